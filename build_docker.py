@@ -3,35 +3,106 @@
 """
 点点素材管理大师 - Docker 镜像打包脚本
 每次交付时执行此脚本，生成可导入的镜像 tar 包，便于用户直接加载并测试运行。
-用法：python build_docker.py
+用法：python build_docker.py [--force]
+源码与依赖未变化且 tar 已存在时跳过构建与导出；--force 强制重新打包。
 """
 
+import argparse
+import hashlib
+import mmap
 import os
 import re
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Optional
 
 _script_dir = Path(__file__).resolve().parent
 os.chdir(_script_dir)
 
+_VERSION_RE = re.compile(rb'__version__\s*=\s*["\']([^"\']+)["\']')
+
 
 def get_version() -> str:
     """从 media_organizer.py 读取 __version__"""
     path = _script_dir / "media_organizer.py"
-    text = path.read_text(encoding="utf-8")
-    m = re.search(r'__version__\s*=\s*["\']([^"\']+)["\']', text)
-    if m:
-        return m.group(1)
+    # mmap 按字节匹配：无需整文件解码，匹配到文件头部的版本号即停止
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        m = _VERSION_RE.search(mm)
+        if m:
+            return m.group(1).decode("utf-8")
     raise RuntimeError("无法从 media_organizer.py 读取 __version__")
 
 
-def run(cmd: list, check: bool = True) -> subprocess.CompletedProcess:
+def _list_source_files() -> List[str]:
+    """列出参与哈希的源码文件：优先 git 跟踪文件，无 git 时遍历目录"""
+    try:
+        out = subprocess.check_output(
+            ["git", "ls-files", "-z"], cwd=_script_dir, stderr=subprocess.DEVNULL
+        )
+        files = [f for f in out.decode("utf-8").split("\0") if f]
+        if files:
+            return sorted(f for f in files if (_script_dir / f).is_file())
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    skip_dirs = {".git", "__pycache__", "data"}
+    files = []
+    for root, dirs, names in os.walk(_script_dir):
+        dirs[:] = [d for d in dirs if d not in skip_dirs]
+        for name in names:
+            if name.endswith((".tar", ".pyc")):
+                continue
+            files.append(Path(root, name).relative_to(_script_dir).as_posix())
+    return sorted(files)
+
+
+def _hash_file(rel: str) -> str:
+    h = hashlib.blake2b(digest_size=32)
+    buf = bytearray(1024 * 1024)
+    view = memoryview(buf)
+    with open(_script_dir / rel, "rb", buffering=0) as f:
+        while n := f.readinto(buf):
+            h.update(view[:n])
+    return h.hexdigest()
+
+
+def compute_source_hash() -> str:
+    """计算源码清单哈希（文件路径 + 内容），并行读取各文件"""
+    files = _list_source_files()
+    with ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) + 4)) as pool:
+        digests = list(pool.map(_hash_file, files))
+    manifest = hashlib.blake2b(digest_size=32)
+    for rel, digest in zip(files, digests):
+        manifest.update(f"{rel}\0{digest}\n".encode("utf-8"))
+    return manifest.hexdigest()
+
+
+def get_image_source_hash(image_tag: str) -> Optional[str]:
+    """读取已有镜像的 source_hash 标签，镜像不存在或无 docker 时返回 None"""
+    try:
+        r = subprocess.run(
+            ["docker", "image", "inspect", image_tag,
+             "--format", '{{index .Config.Labels "source_hash"}}'],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+        )
+    except OSError:
+        return None
+    if r.returncode != 0:
+        return None
+    return r.stdout.strip() or None
+
+
+def run(cmd: list, check: bool = True, env: dict = None) -> subprocess.CompletedProcess:
     print("  ", " ".join(cmd))
-    return subprocess.run(cmd, check=check)
+    return subprocess.run(cmd, check=check, env=env)
 
 
 def main():
+    parser = argparse.ArgumentParser(description="点点素材管理大师 - Docker 镜像打包")
+    parser.add_argument("--force", action="store_true", help="忽略源码哈希，强制重新构建并导出")
+    args = parser.parse_args()
+
     version = get_version()
     image_name = "sucai-zhengliqi"
     image_tag = f"{image_name}:v{version}"
@@ -40,9 +111,20 @@ def main():
     print(f"点点素材管理大师 - Docker 打包 v{version}")
     print("-" * 50)
 
+    source_hash = compute_source_hash()
+    if not args.force and Path(tar_name).is_file() and get_image_source_hash(image_tag) == source_hash:
+        print(f"\n源码与依赖未变化，镜像与 {tar_name} 已是最新，跳过打包（--force 可强制重建）")
+        return 0
+
     # 1. 构建镜像
     print("\n[1/2] 构建镜像...")
-    run(["docker", "build", "--build-arg", f"VERSION={version}", "-t", image_tag, "."])
+    # 启用 BuildKit：Dockerfile 中的 pip 缓存挂载与多阶段并行构建依赖它
+    build_env = {**os.environ, "DOCKER_BUILDKIT": "1"}
+    run(
+        ["docker", "build", "--progress=plain", "--build-arg", f"VERSION={version}",
+         "--label", f"source_hash={source_hash}", "-t", image_tag, "."],
+        env=build_env,
+    )
 
     # 2. 导出为 tar
     print("\n[2/2] 导出镜像...")
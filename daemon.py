@@ -6,11 +6,21 @@
 """
 
 import os
+import re
 import sys
 import time
+import stat
+import queue
+import atexit
+import select
+import signal
 import logging
+import threading
+import logging.handlers
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Set, Tuple
 
 _script_dir = os.path.dirname(os.path.abspath(__file__))
 if _script_dir not in sys.path:
@@ -28,59 +38,360 @@ def _ensure_data_dir():
     if not dev_db.exists():
         src = Path(_script_dir) / "device_suffixes.json"
         if src.exists():
-            import shutil
-            shutil.copy2(str(src), str(dev_db))
+            st = src.stat()
+            with open(src, "rb") as fs, open(dev_db, "wb") as fd:
+                if hasattr(os, "sendfile"):
+                    # 内核内拷贝，无需经用户态缓冲
+                    offset = 0
+                    while offset < st.st_size:
+                        sent = os.sendfile(fd.fileno(), fs.fileno(), offset, st.st_size - offset)
+                        if sent == 0:
+                            break
+                        offset += sent
+                else:
+                    fd.write(fs.read())
+            os.chmod(dev_db, stat.S_IMODE(st.st_mode))
 
 
 _ensure_data_dir()
 from media_organizer import Config, MediaOrganizer, get_log_file_path, PROJECT_NAME, __version__
 
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
+    inotify_flags = None
+
+# 日志经队列异步输出：拷贝线程只入队，stdout 写入由单独的监听线程完成
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _stdout_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))  # 入队时仅合并参数，时间与级别由监听端格式化
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-    ],
+    handlers=[_queue_handler],
 )
 logger = logging.getLogger(__name__)
 
 
-def _list_mount_candidates(watch_path: Path) -> List[Path]:
-    """列出 watch_path 下的一级子目录，视为可能的挂载点。"""
+MountKey = Tuple[str, int, int]  # (目录名, st_dev, st_ino)
+
+
+def _list_mount_candidates(watch_path: Path, resolved: Dict[MountKey, Path]) -> List[Tuple[MountKey, Path]]:
+    """列出 watch_path 下的一级子目录，视为可能的挂载点，返回 [(指纹, 路径)]。
+    resolved 缓存上一轮已校验过的指纹，只对新出现的目录做 resolve()。"""
     out = []
     if not watch_path.exists() or not watch_path.is_dir():
         return out
     try:
-        for p in watch_path.iterdir():
-            if p.is_dir() and not p.name.startswith("."):
+        with os.scandir(watch_path) as it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    continue
+                # is_dir() 直接取 readdir 返回的类型，非目录无需 stat
                 try:
-                    p.resolve()
-                    out.append(p)
+                    if not entry.is_dir():
+                        continue
+                    # 挂载点的 d_ino 是底层目录的 inode，设备指纹仍需 stat 取挂载后的 st_dev/st_ino
+                    st = entry.stat()
                 except OSError:
-                    pass
+                    continue
+                key = (entry.name, st.st_dev, st.st_ino)
+                if key not in resolved:
+                    p = Path(entry.path)
+                    try:
+                        p.resolve()
+                    except OSError:
+                        continue
+                    resolved[key] = p
+                out.append((key, resolved[key]))
     except OSError as e:
         logger.debug("列出 %s 失败: %s", watch_path, e)
     return out
 
 
-def run_daemon():
-    config = Config()
+# inotify 报告新目录后再等一会儿：挂载点目录先创建、设备随后才挂上
+MOUNT_SETTLE_SEC = 2
+# 挂载表变化时内核对该文件置 POLLPRI，无需 root 即可即时得知新挂载
+MOUNTINFO_PATH = "/proc/self/mountinfo"
+
+
+def _unescape_mount_field(s: str) -> str:
+    """mountinfo 中空格等字符以 \\ooo 八进制转义。"""
+    return re.sub(r"\\([0-7]{3})", lambda m: chr(int(m.group(1), 8)), s)
+
+
+DISK_BY_UUID = "/dev/disk/by-uuid"
+# 快速采样的目录深度：DCIM/100CANON 这一层目录的 mtime 会随新拍文件变化
+SAMPLE_DEPTH = 2
+
+
+def _mount_sources() -> Dict[str, str]:
+    """解析挂载表：挂载点 -> 设备源（如 /dev/sdb1）。"""
+    out = {}
+    try:
+        with open(MOUNTINFO_PATH, "r", encoding="utf-8", errors="surrogateescape") as f:
+            for line in f:
+                pre, sep, post = line.rstrip("\n").partition(" - ")
+                fields = pre.split(" ")
+                tail = post.split(" ")
+                if sep and len(fields) >= 5 and len(tail) >= 2:
+                    out[_unescape_mount_field(fields[4])] = _unescape_mount_field(tail[1])
+    except OSError:
+        pass
+    return out
+
+
+class _DeviceIdentity:
+    """按 st_dev 缓存设备的文件系统 UUID（挂载表 + /dev/disk/by-uuid），无法确定时为 None。"""
+
+    def __init__(self):
+        self._cache: Dict[int, Optional[str]] = {}
+
+    def uuid(self, mount: Path, st_dev: int) -> Optional[str]:
+        if st_dev in self._cache:
+            return self._cache[st_dev]
+        uuid = None
+        src = _mount_sources().get(os.path.realpath(mount))
+        if src and src.startswith("/dev/"):
+            src = os.path.realpath(src)
+            try:
+                with os.scandir(DISK_BY_UUID) as it:
+                    for entry in it:
+                        if os.path.realpath(entry.path) == src:
+                            uuid = entry.name
+                            break
+            except OSError:
+                pass
+        self._cache[st_dev] = uuid
+        return uuid
+
+    def prune(self, live_devs: Set[int]):
+        """设备拔出后 st_dev 可能被新设备复用，只保留当前仍在的。"""
+        for dev in set(self._cache) - live_devs:
+            del self._cache[dev]
+
+
+def _quick_sample(mount: Path, depth: int = SAMPLE_DEPTH) -> Tuple[int, int]:
+    """对设备前 depth 层目录做一次 scandir 采样，返回 (最大 mtime_ns, 条目数)。
+    新增文件会改变所在目录的 mtime 或条目数，未变化即可跳过整盘遍历。"""
+    try:
+        max_mtime = os.stat(mount).st_mtime_ns
+    except OSError:
+        return (0, 0)
+    count = 0
+    stack = [(str(mount), 1)]
+    while stack:
+        path, d = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    count += 1
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    max_mtime = max(max_mtime, st.st_mtime_ns)
+                    if d < depth and stat.S_ISDIR(st.st_mode):
+                        stack.append((entry.path, d + 1))
+        except OSError:
+            pass
+    return (max_mtime, count)
+
+
+class _MountWatcher:
+    """等待 watch_paths 下出现新设备：Linux 上监听挂载表（/proc/self/mountinfo）与 inotify 新目录（需 inotify_simple），
+    否则按间隔轮询；收到 SIGTERM 立即返回。"""
+
+    def __init__(self, watch_paths: List[str]):
+        self._stop_event = threading.Event()
+        self._inotify = None
+        self._wds: List[int] = []
+        self._mountinfo = None
+        self._mounts: Set[str] = set()
+        self._roots: List[str] = []
+        self._wake_r = self._wake_w = None
+        if os.name == "nt":
+            return
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_w, False)
+        self._roots = [os.path.realpath(w) for w in watch_paths]
+        try:
+            self._mountinfo = open(MOUNTINFO_PATH, "r", encoding="utf-8", errors="surrogateescape")
+            self._mounts = self._watched_mounts()
+        except OSError as e:
+            self._mountinfo = None
+            logger.debug("无法监听挂载表 %s: %s", MOUNTINFO_PATH, e)
+        if INotify is None:
+            return
+        try:
+            self._inotify = INotify()
+            self._add_watches(watch_paths)
+        except OSError as e:
+            self._inotify = None
+            logger.warning("inotify 初始化失败，改用轮询: %s", e)
+
+    def _add_watches(self, watch_paths: List[str]):
+        mask = inotify_flags.CREATE | inotify_flags.MOVED_TO | inotify_flags.ONLYDIR
+        for w in watch_paths:
+            if os.path.isdir(w):
+                self._wds.append(self._inotify.add_watch(w, mask))
+
+    def _watched_mounts(self) -> Set[str]:
+        """重读挂载表（同时清除 POLLPRI），返回位于 watch_paths 之下的挂载点。"""
+        self._mountinfo.seek(0)
+        out = set()
+        for line in self._mountinfo.read().splitlines():
+            fields = line.split(" ")
+            if len(fields) < 5:
+                continue
+            mp = _unescape_mount_field(fields[4])
+            if any(mp.startswith(root.rstrip(os.sep) + os.sep) for root in self._roots):
+                out.add(mp)
+        return out
+
+    def set_paths(self, watch_paths: List[str]):
+        """监控路径变更（配置重新加载）时替换 inotify 监视与挂载表过滤。"""
+        self._roots = [os.path.realpath(w) for w in watch_paths]
+        if self._mountinfo is not None:
+            self._mounts = self._watched_mounts()
+        if self._inotify is None:
+            return
+        for wd in self._wds:
+            try:
+                self._inotify.rm_watch(wd)
+            except OSError:
+                pass
+        self._wds = []
+        try:
+            self._add_watches(watch_paths)
+        except OSError as e:
+            logger.warning("inotify 更新监控路径失败: %s", e)
+
+    @property
+    def mode(self) -> str:
+        if self._mountinfo is not None and self._inotify is not None:
+            return "挂载表+inotify"
+        if self._mountinfo is not None:
+            return "挂载表"
+        return "inotify" if self._inotify is not None else "轮询"
+
+    @property
+    def event_driven(self) -> bool:
+        """是否由内核事件唤醒（否则需靠轮询发现新设备）。"""
+        return self._mountinfo is not None or self._inotify is not None
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop_event.is_set()
+
+    def wake(self):
+        """让进行中的 wait() 提前返回（不视为新设备）。"""
+        if self._wake_w is not None:
+            try:
+                os.write(self._wake_w, b"\0")
+            except OSError:
+                pass
+
+    def stop(self):
+        self._stop_event.set()
+        self.wake()
+
+    def wait(self, timeout: float) -> bool:
+        """最多等待 timeout 秒；有新挂载或新目录出现时返回 True。"""
+        if self._wake_r is None:
+            self._stop_event.wait(timeout)
+            return False
+        fds = [self._wake_r]
+        if self._inotify is not None:
+            fds.append(self._inotify.fileno())
+        xfds = [self._mountinfo] if self._mountinfo is not None else []
+        r, _, x = select.select(fds, [], xfds, timeout)
+        if self._wake_r in r:
+            os.read(self._wake_r, 64)
+        arrived = False
+        if x:
+            mounts = self._watched_mounts()
+            arrived = bool(mounts - self._mounts)
+            self._mounts = mounts
+        if self._inotify is not None and self._inotify.fileno() in r:
+            # 排除 rm_watch 产生的 IN_IGNORED，只关心新建/移入的目录
+            events = [e for e in self._inotify.read(timeout=0) if not e.mask & inotify_flags.IGNORED]
+            if events and not arrived and not self.stopped:
+                select.select([self._wake_r], [], [], MOUNT_SETTLE_SEC)
+            arrived = arrived or bool(events)
+        return arrived
+
+
+class _ArrivalStats:
+    """轮询模式下记录新设备出现的时间间隔，按经验分布估计下一轮内出现新设备的概率，
+    概率越高轮询越密（下限 min_sleep），否则保持 max_sleep。"""
+
+    def __init__(self, min_sleep: float, max_sleep: float, history: int = 200):
+        self.min_sleep = min_sleep
+        self.max_sleep = max_sleep
+        self._gaps = deque(maxlen=history)
+        self._last: Optional[float] = None
+
+    def record(self, now: float):
+        if self._last is not None:
+            self._gaps.append(now - self._last)
+        self._last = now
+
+    def next_sleep(self, now: float) -> float:
+        if self._last is None or len(self._gaps) < 5:
+            return self.max_sleep
+        t = now - self._last
+        # 已等待 t 秒的前提下，下一个 max_sleep 窗口内到达的条件概率（经验风险率）
+        survived = [g for g in self._gaps if g >= t]
+        if not survived:
+            return self.max_sleep
+        hazard = sum(1 for g in survived if g < t + self.max_sleep) / len(survived)
+        sleep = self.max_sleep - (self.max_sleep - self.min_sleep) * hazard
+        return max(self.min_sleep, min(self.max_sleep, sleep))
+
+
+def _copy_one(
+    organizer: MediaOrganizer, mount: Path, target: Path, copy_threads: int, source_id: Optional[str] = None
+) -> Dict:
+    """对单个挂载点执行一次超级拷贝（在线程池中运行）。source_id 为卷 UUID，已拷贝记录据此识别设备。"""
+    logger.info("检测到设备路径: %s，开始超级拷贝…", mount)
+    return organizer.super_copy_and_organize(
+        source=mount,
+        target=target,
+        dry_run=False,
+        progress_cb=None,
+        copy_threads=copy_threads,
+        source_id=source_id,
+    )
+
+
+def _auto_copy_settings(config: Config) -> Dict:
+    """读取 config.auto_copy 各项并套用默认值与下限。"""
     ac = getattr(config, "auto_copy", None) or {}
-    enabled = ac.get("enabled", False)
-    watch_paths = ac.get("watch_paths") or ["/media"]
-    target_path = (ac.get("target_path") or "").strip()
-    poll_interval = max(15, int(ac.get("poll_interval_sec") or 60))
+    return {
+        "enabled": bool(ac.get("enabled", False)),
+        "watch_paths": list(ac.get("watch_paths") or ["/media"]),
+        "target_path": (ac.get("target_path") or "").strip(),
+        "poll_interval": max(15, int(ac.get("poll_interval_sec") or 60)),
+        "max_mounts": max(1, int(ac.get("max_concurrent_mounts") or 2)),
+        "copy_threads": int(ac.get("copy_threads") or 0),
+    }
 
-    if not enabled:
-        logger.info("自动拷贝未启用（config.json 中 auto_copy.enabled = true 后生效）")
-        while True:
-            time.sleep(3600)
-        return
 
-    if not target_path:
-        logger.error("auto_copy.target_path 未配置，请指定 NAS 上的目标目录")
-        sys.exit(1)
+def _config_mtime(config: Config) -> Optional[int]:
+    try:
+        return os.stat(config.config_file).st_mtime_ns
+    except OSError:
+        return None
 
+
+def _ensure_target(target_path: str) -> Optional[Path]:
+    """确保目标目录存在，失败返回 None。"""
     target = Path(target_path)
     if not target.exists():
         try:
@@ -88,32 +399,131 @@ def run_daemon():
             logger.info("已创建目标目录: %s", target)
         except Exception as e:
             logger.error("无法创建目标目录 %s: %s", target, e)
-            sys.exit(1)
+            return None
+    return target
 
-    logger.info("%s v%s 守护进程启动，监控路径: %s，目标: %s，间隔 %ds",
-                PROJECT_NAME, __version__, watch_paths, target, poll_interval)
+
+def run_daemon():
+    config = Config()
+    config_mtime = _config_mtime(config)
+    settings = _auto_copy_settings(config)
+
+    if not settings["enabled"]:
+        logger.info("自动拷贝未启用（config.json 中 auto_copy.enabled = true 后生效）")
+        stop = threading.Event()
+        signal.signal(signal.SIGTERM, lambda *_: stop.set())
+        stop.wait()
+        logger.info("收到停止信号，守护进程退出")
+        return
+
+    if not settings["target_path"]:
+        logger.error("auto_copy.target_path 未配置，请指定 NAS 上的目标目录")
+        sys.exit(1)
+
+    target = _ensure_target(settings["target_path"])
+    if target is None:
+        sys.exit(1)
+
+    watcher = _MountWatcher(settings["watch_paths"])
+    signal.signal(signal.SIGTERM, lambda *_: watcher.stop())
+    logger.info("%s v%s 守护进程启动，监控路径: %s（%s），目标: %s，间隔 %ds，并发设备数 %d",
+                PROJECT_NAME, __version__, settings["watch_paths"], watcher.mode, target,
+                settings["poll_interval"], settings["max_mounts"])
 
     organizer = MediaOrganizer(config)
-    while True:
+    arrivals = _ArrivalStats(min_sleep=15, max_sleep=settings["poll_interval"])
+    resolved: Dict[MountKey, Path] = {}
+    known_mounts: Set[MountKey] = set()
+    identities = _DeviceIdentity()
+    # 已完整拷贝过的设备（有 UUID 用 UUID，否则用挂载指纹）-> 拷贝前的快速采样；采样未变化则不再遍历整盘
+    processed: Dict[object, Tuple[int, int]] = {}
+    # 常驻拷贝线程池：拷贝在后台进行，主循环继续发现新设备，不必等本轮全部拷完
+    copy_pool = ThreadPoolExecutor(max_workers=settings["max_mounts"])
+    # 进行中的拷贝：设备标识 -> (Future, 挂载路径, 拷贝前采样)
+    inflight: Dict[object, Tuple[Future, Path, Tuple[int, int]]] = {}
+    while not watcher.stopped:
         try:
-            for watch_str in watch_paths:
-                watch = Path(watch_str)
-                for mount in _list_mount_candidates(watch):
-                    try:
-                        logger.info("检测到设备路径: %s，开始超级拷贝…", mount)
-                        stats = organizer.super_copy_and_organize(
-                            source=mount,
-                            target=target,
-                            dry_run=False,
-                            progress_cb=None,
-                        )
-                        logger.info("超级拷贝完成 源=%s 成功=%d 失败=%d 跳过=%d",
-                                    mount, stats["ok"], stats["fail"], stats["skip"])
-                    except Exception as e:
-                        logger.exception("超级拷贝失败 源=%s: %s", mount, e)
+            for ident, (fut, mount, sample) in list(inflight.items()):
+                if not fut.done():
+                    continue
+                del inflight[ident]
+                try:
+                    stats = fut.result()
+                    logger.info("超级拷贝完成 源=%s 成功=%d 失败=%d 跳过=%d",
+                                mount, stats["ok"], stats["fail"], stats["skip"])
+                    report = stats.get("report") or {}
+                    # 关联文件与其他文件的失败只记在报告里、不计入 fail，同样须留待下一轮重试
+                    if stats["fail"] == 0 and not report.get("media_fail") and not report.get("other_fail"):
+                        processed[ident] = sample
+                except Exception as e:
+                    logger.exception("超级拷贝失败 源=%s: %s", mount, e)
+
+            # 每轮仅 stat 一次 config.json，mtime 变化时才重新加载配置并重建 MediaOrganizer；
+            # 有拷贝进行中时推迟到其结束，避免新旧 MediaOrganizer 的目标预留互不可见
+            mtime = _config_mtime(config)
+            if mtime is not None and mtime != config_mtime and not inflight:
+                config_mtime = mtime
+                config = Config()
+                new = _auto_copy_settings(config)
+                if new["target_path"] != settings["target_path"]:
+                    new_target = _ensure_target(new["target_path"]) if new["target_path"] else None
+                    if new_target is None:
+                        logger.error("auto_copy.target_path 无效，沿用原目标目录 %s", target)
+                        new["target_path"] = settings["target_path"]
+                    else:
+                        target = new_target
+                if new["watch_paths"] != settings["watch_paths"]:
+                    watcher.set_paths(new["watch_paths"])
+                if new["max_mounts"] != settings["max_mounts"]:
+                    copy_pool.shutdown(wait=False)
+                    copy_pool = ThreadPoolExecutor(max_workers=new["max_mounts"])
+                settings = new
+                arrivals.max_sleep = settings["poll_interval"]
+                organizer = MediaOrganizer(config)
+                logger.info("配置已变更并重新加载：%s监控路径: %s，目标: %s，间隔 %ds，并发设备数 %d",
+                            "" if settings["enabled"] else "自动拷贝已暂停，",
+                            settings["watch_paths"], target, settings["poll_interval"], settings["max_mounts"])
+
+            found: List[Tuple[MountKey, Path]] = []
+            if settings["enabled"]:
+                for watch_str in settings["watch_paths"]:
+                    found.extend(_list_mount_candidates(Path(watch_str), resolved))
+            current = {key for key, _ in found}
+            if current - known_mounts:
+                arrivals.record(time.monotonic())
+            known_mounts = current
+            for key in set(resolved) - current:
+                del resolved[key]
+            identities.prune({key[1] for key in current})
+            # 无 UUID 的设备拔出后指纹即失效，不再保留；有 UUID 的设备重新插入且未变化时仍可跳过
+            for ident in [i for i in processed if isinstance(i, tuple) and i not in current]:
+                del processed[ident]
+            for key, mount in found:
+                ident = identities.uuid(mount, key[1]) or key
+                if ident in inflight:
+                    continue
+                sample = _quick_sample(mount)
+                if processed.get(ident) == sample:
+                    continue
+                # 慢速设备不阻塞其他设备；目标路径冲突由 MediaOrganizer 的目标预留处理
+                fut = copy_pool.submit(
+                    _copy_one, organizer, mount, target, settings["copy_threads"],
+                    ident if isinstance(ident, str) else None,
+                )
+                fut.add_done_callback(lambda _: watcher.wake())
+                inflight[ident] = (fut, mount, sample)
         except Exception as e:
             logger.exception("本轮检查异常: %s", e)
-        time.sleep(poll_interval)
+        if watcher.event_driven:
+            wait_sec = settings["poll_interval"]
+        else:
+            wait_sec = arrivals.next_sleep(time.monotonic())
+        if watcher.wait(wait_sec):
+            logger.info("检测到新挂载目录，立即检查")
+    if inflight:
+        logger.info("收到停止信号，等待 %d 个进行中的拷贝完成…", len(inflight))
+    copy_pool.shutdown(wait=True)
+    logger.info("收到停止信号，守护进程退出")
 
 
 if __name__ == "__main__":
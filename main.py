@@ -13,5 +13,7 @@ if _script_dir not in sys.path:
 os.chdir(_script_dir)
 
 if __name__ == "__main__":
+    import multiprocessing
+    multiprocessing.freeze_support()
     from organizer_gui import main
     main()
@@ -7,38 +7,84 @@
 2. 超级拷贝：将指定源文件夹拷贝到目标目录，自动整理归类，并哈希校验确保文件完整性
 """
 
-__version__ = "0.7"
+__version__ = "0.7.76"
 PROJECT_NAME = "点点素材管理大师"
 
 import os
 import re
 import sys
+import time
+import errno
+import queue
+import atexit
+import bisect
 import json
 import logging
+import logging.handlers
+import mmap
 import shutil
 import subprocess
 import hashlib
+import tempfile
+import threading
+import weakref
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, List, Tuple, Set
+from typing import Callable, Iterator, Optional, Dict, List, Tuple, Set
 from dataclasses import dataclass, field
 
 try:
-    from PIL import Image
-    from PIL.ExifTags import TAGS
+    import blake3
 except ImportError:
-    Image = None
-    TAGS = {}
+    blake3 = None
 
 try:
-    from hachoir.metadata import extractMetadata
-    from hachoir.parser import createParser
+    import xxhash
 except ImportError:
-    extractMetadata = None
-    createParser = None
+    xxhash = None
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# PIL / hachoir 较重，首次用到时才导入（只有视频的扫描不加载 PIL，只有图片的不加载 hachoir）
+_NOT_LOADED = object()
+_pil_image = _NOT_LOADED
+_hachoir_funcs = _NOT_LOADED
+
+
+def _pil():
+    """返回 PIL.Image 模块，未安装时返回 None。"""
+    global _pil_image
+    if _pil_image is _NOT_LOADED:
+        try:
+            from PIL import Image
+        except ImportError:
+            Image = None
+        _pil_image = Image
+    return _pil_image
+
+
+def _hachoir():
+    """返回 (createParser, extractMetadata)，未安装 hachoir 时均为 None。"""
+    global _hachoir_funcs
+    if _hachoir_funcs is _NOT_LOADED:
+        try:
+            from hachoir.metadata import extractMetadata
+            from hachoir.parser import createParser
+        except ImportError:
+            extractMetadata = None
+            createParser = None
+        _hachoir_funcs = (createParser, extractMetadata)
+    return _hachoir_funcs
+
 
 LOG_FILE = "media_organizer.log"
 _log_fmt = "%(asctime)s - %(levelname)s - %(message)s"
+LOG_BUFFER_RECORDS = 1024  # 日志先缓冲，满此条数批量写入文件
+LOG_FLUSH_INTERVAL = 2.0  # 距上次写入超过此秒数的新记录会触发写入，避免日志文件长时间落后
 logger = logging.getLogger(__name__)
 
 
@@ -61,28 +107,67 @@ def get_log_file_path() -> str:
     return str(_log_file_path())
 
 
+class _BufferedFileLogHandler(logging.handlers.MemoryHandler):
+    """缓冲日志记录，满 LOG_BUFFER_RECORDS 条、出现 WARNING 及以上或距上次写入超过 LOG_FLUSH_INTERVAL 秒时，
+    将整批记录格式化后一次写入目标文件（一次 write + flush），而不是每条记录各写一次。"""
+
+    def __init__(self, target: logging.FileHandler):
+        super().__init__(LOG_BUFFER_RECORDS, flushLevel=logging.WARNING, target=target)
+        self._last_flush = time.monotonic()
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        return super().shouldFlush(record) or time.monotonic() - self._last_flush >= LOG_FLUSH_INTERVAL
+
+    def flush(self):
+        with self.lock:
+            target = self.target
+            if self.buffer and target is not None:
+                try:
+                    text = "".join(target.format(r) + target.terminator for r in self.buffer)
+                    with target.lock:
+                        if target.stream is None:
+                            target.stream = target._open()
+                        target.stream.write(text)
+                        target.stream.flush()
+                except Exception:
+                    self.handleError(self.buffer[-1])
+                self.buffer.clear()
+            self._last_flush = time.monotonic()
+
+
+def _add_file_log_handler():
+    fh = logging.FileHandler(str(_log_file_path()), encoding="utf-8")
+    fh.setFormatter(logging.Formatter(_log_fmt))
+    logger.addHandler(_BufferedFileLogHandler(fh))
+
+
+def flush_log():
+    """立即写出缓冲中的日志（任务结束、打开日志文件前调用）。"""
+    for h in logger.handlers:
+        h.flush()
+
+
 logger.setLevel(logging.INFO)
 if not logger.handlers:
-    _fh = logging.FileHandler(str(_log_file_path()), encoding="utf-8")
-    _fh.setFormatter(logging.Formatter(_log_fmt))
-    logger.addHandler(_fh)
+    _add_file_log_handler()
 
 
 def reset_log_file():
     """清空日志并写入版本标识。"""
     global logger
     for h in logger.handlers[:]:
-        if isinstance(h, logging.FileHandler):
+        if isinstance(h, (_BufferedFileLogHandler, logging.FileHandler)):
             try:
+                target = getattr(h, "target", None)
                 h.close()
+                if target is not None:
+                    target.close()
             except Exception:
                 pass
             logger.removeHandler(h)
     with open(_log_file_path(), "w", encoding="utf-8") as f:
         f.write(f"--- 日志已清空 ({PROJECT_NAME} v{__version__}) {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ---\n")
-    _fh = logging.FileHandler(str(_log_file_path()), encoding="utf-8")
-    _fh.setFormatter(logging.Formatter(_log_fmt))
-    logger.addHandler(_fh)
+    _add_file_log_handler()
 
 
 logger.info("%s v%s", PROJECT_NAME, __version__)
@@ -97,25 +182,434 @@ AUDIO_EXTENSIONS = {".mp3", ".m4a", ".wav", ".aac", ".flac", ".ogg", ".wma"}
 # 全景/360 常用扩展或需单独归类的
 PANORAMIC_EXTENSIONS = {".360", ".insv", ".osv"}
 LEAVE_IN_PLACE_EXTENSIONS = {".op", ".ed", ".lrprev", ".lock"}
-SUPER_COPY_HASH_ALGO = "sha256"
-SUPER_COPY_CHUNK_SIZE = 64 * 1024  # 64KB
+# 校验哈希只用于比较同一次拷贝的源与目标，优先用 SIMD 加速的 BLAKE3，未安装时回退 SHA256
+SUPER_COPY_HASH_ALGO = "blake3" if blake3 else "sha256"
+SUPER_COPY_CHUNK_SIZE = 1024 * 1024  # 1MB，BLAKE3 多线程需较大的单次输入
+COPY_CHUNK_SIZE = 8 * 1024 * 1024  # 内核拷贝单次请求 8MB；回退的用户态拷贝用 1MB
+MMAP_HASH_THRESHOLD = 16 * 1024 * 1024  # 不小于此大小的文件映射到内存后整体送入哈希，省去拷贝到读缓冲区
+BLAKE3_PARALLEL_MIN_SIZE = 1024 * 1024  # BLAKE3 对不小于此大小的文件多线程计算（更小的文件线程开销大于收益）
+BLAKE3_READ_CHUNK_SIZE = 4 * 1024 * 1024  # 不映射时 BLAKE3 每次送入 4MB，保证每次输入足够多线程切分
+IO_BUF = 1024 * 1024  # 记录文件等文本读写的缓冲区（默认 8KB 时大 JSON 要分成上千次系统调用）
+SCAN_THREADS = 8  # 收集媒体文件时并行读取目录的线程数
+PREFETCH_MIN_SIZE = 16 * 1024 * 1024  # 不小于此大小的文件分块拷贝时由后台线程预读下一块，与哈希/写入重叠
+PREFETCH_DEPTH = 2  # 预读领先的块数，占用内存为 (PREFETCH_DEPTH + 1) 个读块
+DROP_CACHE_THRESHOLD = 64 * 1024 * 1024  # 大于此大小的文件拷贝时分段释放页缓存，避免多 GB 视频挤掉其他缓存
+SMALL_COPY_MAX = 64 * 1024  # 小于此大小的文件（XMP/THM 等边车）需哈希时整体读入、一次写出
+COPIED_INDEX_SAVE_EVERY = 200  # 超级拷贝每新增多少条记录落盘一次
+PROCESSED_SAVE_EVERY = 500  # 整理每新增多少条已处理记录落盘一次
+RSYNC_MIN_FILES = 200  # 其他文件不少于此数量时先交给一次 rsync 批量拷贝（POSIX 且已安装 rsync）
+PROGRESS_MIN_INTERVAL = 0.05  # 不带消息的进度计数事件最短送达间隔（秒），进度变化达 1% 时不受限
+
+# 目录名中不允许的字符逐个替换为下划线
+_SANITIZE_TABLE = str.maketrans({c: "_" for c in '<>:"/\\|?*'})
+# 每个文件都会用到的正则，模块加载时编译一次
+_SAFE_WITH_SPACE_RE = re.compile(r'[<>:"/\\|?*\s]+')
+_DATE_COMPACT_RE = re.compile(r"^\d{8}$")
+_DATE_DASH_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_DATE_SLASH_RE = re.compile(r"^\d{4}/\d{2}/\d{2}$")
+_FPS_NUMERIC_RE = re.compile(r"^\d+(\.\d+)?$")
+_FPS_EXTRACT_RE = re.compile(r"(\d+(?:\.\d+)?)\s*fps?", re.I)
+_PANO_HINT_RE = re.compile(r"360|panoram|theta", re.I)  # insta360 已含 360
+
+
+def _advise_sequential(fd: int):
+    """提示内核该文件将顺序读完，加大预读窗口、减少读请求次数（仅 POSIX）。"""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+def _resolve_hash_algo(name: str) -> str:
+    """配置的校验算法（auto / sha256 / blake3 / xxh3_128 / 其他 hashlib 算法）转为可用的算法名，
+    所需模块未安装时回退到默认算法。"""
+    name = (name or "auto").strip().lower()
+    if name == "auto":
+        return SUPER_COPY_HASH_ALGO
+    if name == "blake3" and blake3:
+        return name
+    if name == "xxh3_128" and xxhash:
+        return name
+    if name in hashlib.algorithms_available:
+        return name
+    logger.warning("校验算法 %s 不可用（未安装对应模块？），改用 %s", name, SUPER_COPY_HASH_ALGO)
+    return SUPER_COPY_HASH_ALGO
+
+
+def _hash_mmap(f, new_hash: Callable[[], object]) -> Optional[str]:
+    """将已打开的文件整体映射后一次送入哈希（BLAKE3 可借此多线程并行）；映射失败返回 None，由调用方改用分块读取。"""
+    try:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            h = new_hash()
+            h.update(mm)
+            return h.hexdigest()
+    except (OSError, ValueError, OverflowError) as e:
+        logger.debug("内存映射哈希失败，改用分块读取: %s", e)
+        return None
 
 
-def _compute_file_hash(path: Path, algo: str = SUPER_COPY_HASH_ALGO) -> Optional[str]:
-    """计算文件哈希值，用于超级拷贝的完整性校验。"""
+_thread_buffers = threading.local()
+
+
+def _read_buffer(size: int) -> memoryview:
+    """返回当前线程复用的读缓冲区（size 字节）：拷贝/哈希大量小文件时不再为每个文件分配数 MB 缓冲。"""
+    buf = getattr(_thread_buffers, "buf", None)
+    if buf is None or len(buf) < size:
+        buf = _thread_buffers.buf = memoryview(bytearray(size))
+    return buf[:size]
+
+
+def _read_blocks(f, chunk_size: int) -> Iterator[memoryview]:
+    """按块读取 f 的剩余内容；产出的块（本线程复用的缓冲区）在下一次迭代前有效。"""
+    view = _read_buffer(chunk_size)
+    while n := f.readinto(view):
+        yield view[:n]
+
+
+def _prefetch_blocks(f, chunk_size: int) -> Iterator[memoryview]:
+    """同 _read_blocks，但由后台线程预读：调用方哈希、写入当前块时下一块已在读取（哈希与读写均释放 GIL）。"""
+    free: "queue.Queue[Optional[memoryview]]" = queue.Queue()
+    for _ in range(PREFETCH_DEPTH + 1):
+        free.put(memoryview(bytearray(chunk_size)))
+    full: "queue.Queue" = queue.Queue()
+
+    def _reader():
+        try:
+            while (buf := free.get()) is not None:
+                n = f.readinto(buf)
+                full.put((buf, n))
+                if not n:
+                    return
+        except BaseException as e:
+            full.put(e)
+
+    reader = threading.Thread(target=_reader, daemon=True)
+    reader.start()
+    try:
+        while True:
+            item = full.get()
+            if isinstance(item, BaseException):
+                raise item
+            buf, n = item
+            if not n:
+                return
+            yield buf[:n]
+            free.put(buf)
+    finally:
+        free.put(None)
+        reader.join()
+
+
+def _hash_factory(algo: str, size: int) -> Tuple[Callable[[], object], int]:
+    """按算法与文件大小返回 (哈希对象工厂, 建议的单次读取大小)。"""
+    if algo == "blake3" and blake3:
+        threads = blake3.blake3.AUTO if size >= BLAKE3_PARALLEL_MIN_SIZE else 1
+        return (lambda: blake3.blake3(max_threads=threads)), BLAKE3_READ_CHUNK_SIZE
+    if algo == "xxh3_128" and xxhash:
+        return xxhash.xxh3_128, SUPER_COPY_CHUNK_SIZE
+    return (lambda: hashlib.new(algo)), SUPER_COPY_CHUNK_SIZE
+
+
+def _compute_file_hash(path: Path, algo: str = SUPER_COPY_HASH_ALGO, use_mmap: bool = True) -> Optional[str]:
+    """计算文件哈希值，用于超级拷贝的完整性校验。大文件默认内存映射后计算（use_mmap=False 时始终分块读取）。"""
     if not path.exists() or not path.is_file():
         return None
-    h = hashlib.new(algo)
     try:
-        with open(path, "rb") as f:
-            while chunk := f.read(SUPER_COPY_CHUNK_SIZE):
-                h.update(chunk)
+        with open(path, "rb", buffering=0) as f:
+            size = os.fstat(f.fileno()).st_size
+            new_hash, chunk_size = _hash_factory(algo, size)
+            use_blake3 = algo == "blake3" and blake3
+            mmap_threshold = MMAP_HASH_THRESHOLD
+            if use_blake3 and os.name != "nt":  # BLAKE3 整体输入才能多线程；Windows 下映射读取不占优，仍按通用门槛
+                mmap_threshold = BLAKE3_PARALLEL_MIN_SIZE
+            if use_mmap and size >= mmap_threshold:
+                digest = _hash_mmap(f, new_hash)
+                if digest is not None:
+                    return digest
+            _advise_sequential(f.fileno())
+            if not use_blake3 and hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, new_hash).hexdigest()
+            # BLAKE3 或 Python 3.10 及以下：复用本线程的缓冲区 readinto，避免每块新建 bytes
+            h = new_hash()
+            view = _read_buffer(chunk_size)
+            while n := f.readinto(view):
+                h.update(view[:n])
         return h.hexdigest()
     except (OSError, IOError) as e:
         logger.warning("计算哈希失败 %s: %s", path, e)
         return None
 
 
+def _name_suffix(name: str) -> str:
+    """文件名的扩展名（含点），与 Path(name).suffix 相同，但不构造 Path。"""
+    i = name.rfind(".")
+    return name[i:] if 0 < i < len(name) - 1 else ""
+
+
+def _scan_dir(top: str, skip_dirs: Set[str] = frozenset()) -> Tuple[List[os.DirEntry], List[str]]:
+    """读取一个目录：返回 (文件条目, 子目录路径)。文件类型取自目录项本身（d_type），普通文件无需再 stat；
+    不跟随目录符号链接，skip_dirs 中的子目录不返回；目录无法读取时返回空。"""
+    files: List[os.DirEntry] = []
+    subdirs: List[str] = []
+    try:
+        with os.scandir(top) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.path not in skip_dirs:
+                            subdirs.append(entry.path)
+                    elif entry.is_file():
+                        files.append(entry)
+                except OSError:
+                    continue
+    except OSError as e:
+        logger.debug("无法读取目录 %s: %s", top, e)
+    return files, subdirs
+
+
+def _walk_files(root: str, skip_dirs: Set[str] = frozenset()) -> Iterator[os.DirEntry]:
+    """深度优先遍历 root 及子目录（不跟随目录符号链接），按 os.walk 的顺序逐个给出文件条目。"""
+    stack = [root]
+    while stack:
+        files, subdirs = _scan_dir(stack.pop(), skip_dirs)
+        yield from files
+        stack.extend(reversed(subdirs))
+
+
+def _walk_dirs_parallel(
+    root: str, skip_dirs: Set[str] = frozenset(), workers: int = SCAN_THREADS
+) -> Iterator[Tuple[str, List[os.DirEntry]]]:
+    """多线程遍历 root 及子目录，逐个目录给出 (目录, 文件条目)，目录之间顺序不定。
+    每个目录由一个线程读取（scandir 读目录时释放 GIL），网络盘/慢速盘上各目录的等待相互重叠。"""
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as ex:
+        pending = {ex.submit(_scan_dir, root, skip_dirs): root}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                top = pending.pop(fut)
+                files, subdirs = fut.result()
+                for d in subdirs:
+                    pending[ex.submit(_scan_dir, d, skip_dirs)] = d
+                if files:
+                    yield top, files
+
+
+def _is_rotational(path: Path) -> bool:
+    """path 所在块设备是否为机械硬盘（Linux 读 /sys 的 queue/rotational；分区取其所属磁盘）；无法判断时为 False。"""
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        st_dev = path.stat().st_dev
+        dev_dir = os.path.realpath(f"/sys/dev/block/{os.major(st_dev)}:{os.minor(st_dev)}")
+        for d in (dev_dir, os.path.dirname(dev_dir)):
+            flag = os.path.join(d, "queue", "rotational")
+            if os.path.exists(flag):
+                with open(flag, "r", encoding="ascii") as f:
+                    return f.read().strip() == "1"
+    except OSError:
+        pass
+    return False
+
+
+def _move_file(src: Path, dest: Path):
+    """移动文件：同一文件系统直接原子重命名；跨设备（EXDEV）时用 _copy_file_data 复制（可走内核拷贝）后删除源。
+    符号链接仍交给 shutil.move，保持移动链接本身的语义。"""
+    try:
+        os.replace(src, dest)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    if os.path.islink(src):
+        shutil.move(str(src), str(dest))
+        return
+    try:
+        _copy_file_data(src, dest)
+    except BaseException:
+        # 不留下半截目标，源文件仍完好
+        try:
+            os.unlink(dest)
+        except OSError:
+            pass
+        raise
+    os.unlink(src)
+
+
+def _drop_cache(fd: int, offset: int, length: int):
+    """通知内核丢弃该范围的页缓存；对脏页会先发起回写（仅 POSIX）。"""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, offset, length, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+
+
+def _preallocate(fd: int, size: int) -> bool:
+    """按源文件大小一次性预分配目标空间，减少边写边分配造成的碎片（仅 POSIX）；失败时静默跳过。"""
+    if size <= 0 or not hasattr(os, "posix_fallocate"):
+        return False
+    try:
+        os.posix_fallocate(fd, 0, size)
+        return True
+    except OSError as e:
+        logger.debug("预分配目标空间失败，直接拷贝: %s", e)
+        return False
+
+
+FICLONE = 0x40049409  # Linux ioctl：目标文件与源共享数据块（写时复制）
+
+
+def _reflink(src_fd: int, dest_fd: int) -> bool:
+    """在 Btrfs/XFS 等支持 reflink 的文件系统上克隆整个文件，不复制数据；跨文件系统或不支持时返回 False。"""
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        fcntl.ioctl(dest_fd, FICLONE, src_fd)
+        return True
+    except OSError:
+        return False
+
+
+def _mac_clonefile(src: Path, dest: Path) -> bool:
+    """macOS APFS 上用 clonefile(2) 克隆整个文件（写时复制，不复制数据）。
+    目标已存在、跨卷、非 APFS 或非 macOS 时返回 False，由调用方走通用拷贝。"""
+    if sys.platform != "darwin":
+        return False
+    import ctypes
+    libc = ctypes.CDLL("/usr/lib/libSystem.B.dylib", use_errno=True)
+    if libc.clonefile(os.fsencode(str(src)), os.fsencode(str(dest)), 0) == 0:
+        return True
+    logger.debug("clonefile 失败（errno %s），改用通用拷贝: %s", ctypes.get_errno(), src)
+    return False
+
+
+def _sendfile_range(src_fd: int, dest_fd: int, count: int) -> int:
+    """以 copy_file_range 的参数顺序调用 sendfile（Linux 2.6.33 起目标可为普通文件）。"""
+    return os.sendfile(dest_fd, src_fd, None, count)
+
+
+# 内核内拷贝候选，依次尝试：copy_file_range（Linux 4.5+，5.3 起可跨文件系统），其次 sendfile
+_KERNEL_COPIES = tuple(
+    f for f in (
+        getattr(os, "copy_file_range", None),
+        _sendfile_range if sys.platform.startswith("linux") and hasattr(os, "sendfile") else None,
+    ) if f is not None
+)
+_KERNEL_COPY_FALLBACK_ERRNOS = (errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM)
+
+
+def _win_copy_file(src: Path, dest: Path) -> bool:
+    """Windows 下交给系统 CopyFileExW：大缓冲拷贝，SMB 共享间可由服务器端完成，并保留时间戳与属性。
+    非 Windows 或调用失败时返回 False，由调用方走通用拷贝。"""
+    if os.name != "nt":
+        return False
+    import ctypes
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    if kernel32.CopyFileExW(str(src), str(dest), None, None, None, 0):
+        return True
+    logger.debug("CopyFileExW 失败（错误码 %s），改用通用拷贝: %s", ctypes.get_last_error(), src)
+    return False
+
+
+def _copy_file_data(src: Path, dest: Path, preallocate: bool = False, hash_algo: Optional[str] = None) -> Optional[str]:
+    """拷贝文件内容并保留时间戳等元数据（同 shutil.copy2）。
+    源与目标在同一支持 reflink 的文件系统（Btrfs/XFS，macOS 上为 APFS）上时直接克隆（瞬间完成，不计算哈希，返回 None）；
+    克隆后目标大小与源不符时改走常规拷贝。
+    Linux 上优先用 os.copy_file_range 在内核内完成（不可用时退到 sendfile），数据不经过 Python 缓冲区；
+    Windows 上不需哈希时用 CopyFileExW；
+    均不可用时回退为 1MB 分块拷贝。
+    preallocate 为 True 时先用 posix_fallocate 预分配目标大小（NFS 等语义不一的目标可在配置中关闭）。
+    给出 hash_algo 时改为分块拷贝，边写边计算源数据哈希（源文件只读一遍），返回其十六进制值；否则返回 None。
+    需哈希的小文件（< SMALL_COPY_MAX）整体读入后一次写出，不走预分配与分块循环。"""
+    if hash_algo is None and _win_copy_file(src, dest):
+        return None
+    if _mac_clonefile(src, dest):
+        # 与 reflink 相同：克隆后至少确认目标大小与源一致，否则删掉目标走常规拷贝
+        if os.stat(dest).st_size == os.stat(src).st_size:
+            shutil.copystat(str(src), str(dest))
+            return None
+        logger.warning("clonefile 克隆后目标大小与源不一致，改为常规拷贝: %s", src)
+        os.unlink(dest)
+    with open(src, "rb", buffering=0) as fsrc, open(dest, "wb", buffering=0) as fdst:
+        if _reflink(fsrc.fileno(), fdst.fileno()):
+            # 克隆不读数据，至少确认目标大小与源一致：共享数据块时空间不足、或源在克隆中被改写都可能留下不完整的目标
+            if os.fstat(fdst.fileno()).st_size == os.fstat(fsrc.fileno()).st_size:
+                fdst.close()
+                shutil.copystat(str(src), str(dest))
+                return None
+            logger.warning("reflink 克隆后目标大小与源不一致，改为常规拷贝: %s", src)
+            fdst.truncate(0)
+            fdst.seek(0)
+            fsrc.seek(0)
+        size = os.fstat(fsrc.fileno()).st_size
+        if hash_algo and size < SMALL_COPY_MAX:
+            data = memoryview(fsrc.read())
+            hasher = _hash_factory(hash_algo, len(data))[0]()
+            hasher.update(data)
+            written = 0
+            while written < len(data):
+                written += fdst.write(data[written:])
+            fdst.close()
+            shutil.copystat(str(src), str(dest))
+            return hasher.hexdigest()
+        _advise_sequential(fsrc.fileno())
+        preallocated = _preallocate(fdst.fileno(), size) if preallocate else False
+        hasher = None
+        chunk_size = SUPER_COPY_CHUNK_SIZE
+        if hash_algo:
+            new_hash, chunk_size = _hash_factory(hash_algo, size)
+            hasher = new_hash()
+        # 大文件每拷贝 DROP_CACHE_THRESHOLD 字节释放一次已完成部分的页缓存：源页直接丢弃，目标脏页提前成段回写
+        drop_cache = size > DROP_CACHE_THRESHOLD
+        copied = dropped = 0
+        for kernel_copy in _KERNEL_COPIES if hasher is None else ():
+            try:
+                while (n := kernel_copy(fsrc.fileno(), fdst.fileno(), COPY_CHUNK_SIZE)) > 0:
+                    copied += n
+                    if drop_cache and copied - dropped >= DROP_CACHE_THRESHOLD:
+                        _drop_cache(fsrc.fileno(), dropped, copied - dropped)
+                        _drop_cache(fdst.fileno(), dropped, copied - dropped)
+                        dropped = copied
+                break
+            except OSError as e:
+                if e.errno not in _KERNEL_COPY_FALLBACK_ERRNOS:
+                    raise
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+                copied = dropped = 0
+                if preallocate:
+                    preallocated = _preallocate(fdst.fileno(), size)
+        # 边拷贝边哈希、回退或内核拷贝提前返回 0（部分文件系统）时，从当前位置分块继续
+        blocks = (_prefetch_blocks if size - copied >= PREFETCH_MIN_SIZE else _read_blocks)(fsrc, chunk_size)
+        try:
+            for block in blocks:
+                n = len(block)
+                if hasher is not None:
+                    hasher.update(block)
+                written = 0
+                while written < n:
+                    written += fdst.write(block[written:])
+                copied += n
+                if drop_cache and copied - dropped >= DROP_CACHE_THRESHOLD:
+                    _drop_cache(fsrc.fileno(), dropped, copied - dropped)
+                    _drop_cache(fdst.fileno(), dropped, copied - dropped)
+                    dropped = copied
+        finally:
+            blocks.close()
+        if preallocated:
+            # 预分配会把文件撑到源大小；源在拷贝中变短时截掉多余部分
+            fdst.truncate(fdst.tell())
+        if drop_cache:
+            _drop_cache(fsrc.fileno(), 0, 0)
+            _drop_cache(fdst.fileno(), 0, 0)
+    shutil.copystat(str(src), str(dest))
+    return hasher.hexdigest() if hasher is not None else None
+
+
 @dataclass
 class MediaInfo:
     """单文件媒体信息."""
@@ -126,6 +620,81 @@ class MediaInfo:
     date_str: str  # 用于目录名，如 2024-01-15
 
 
+class _PathSet:
+    """路径字符串集合：按目录分组为 {目录: {文件名}}，目录串只存一份。
+    大量同目录文件时内存约为整路径集合的一半以下，且与路径长度基本无关。"""
+
+    __slots__ = ("_dirs", "_count")
+
+    def __init__(self, paths=()):
+        self._dirs: Dict[str, Set[str]] = {}
+        self._count = 0
+        for p in paths:
+            self.add(p)
+
+    def add(self, path: str):
+        head, tail = os.path.split(path)
+        names = self._dirs.get(head)
+        if names is None:
+            names = self._dirs[head] = set()
+        if tail not in names:
+            names.add(tail)
+            self._count += 1
+
+    def __contains__(self, path: str) -> bool:
+        head, tail = os.path.split(path)
+        names = self._dirs.get(head)
+        return names is not None and tail in names
+
+    def __iter__(self) -> Iterator[str]:
+        for head, names in self._dirs.items():
+            for tail in names:
+                yield os.path.join(head, tail)
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class _ThrottledProgress:
+    """超级拷贝进度回调节流：只合并不带消息的 "progress" 计数事件，距上次送达不足 PROGRESS_MIN_INTERVAL
+    且进度变化不足 1% 的直接丢弃。带消息的事件（界面会写入运行日志）、起始与完成事件总是送达。"""
+
+    def __init__(self, callback: Callable[[str, str, Optional[int], Optional[int]], None]):
+        self._callback = callback
+        self._last = 0.0
+        self._last_current = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, phase: str, message: str, current: Optional[int] = None, total: Optional[int] = None):
+        if phase == "progress" and not message and current and total and current < total:
+            now = time.monotonic()
+            with self._lock:
+                if now - self._last < PROGRESS_MIN_INTERVAL and (current - self._last_current) * 100 < total:
+                    return
+                self._last, self._last_current = now, current
+        self._callback(phase, message, current, total)
+
+
+@dataclass
+class FilePlan:
+    """单个主文件的整理计划：只读识别的结果（类型/日期/设备/目标目录/统一命名），不含任何移动。"""
+    path: Path
+    path_key: str
+    info: Optional[MediaInfo] = None  # None 表示非媒体文件
+    target_dir: Optional[Path] = None
+    unified_basename: Optional[str] = None
+    already_processed: bool = False  # 此前已整理到正确位置，无需再处理
+
+
+@dataclass
+class _PillowInfo:
+    """一次 Image.open 读出的尺寸与 EXIF（日期/设备），供日期、设备、分辨率共用。"""
+    size: Optional[Tuple[int, int]] = None
+    make: str = ""
+    model: str = ""
+    dates: List[str] = field(default_factory=list)  # 按 DateTimeOriginal/DateTimeDigitized/DateTime 优先级
+
+
 class Config:
     """配置类。配置与日志路径基于程序所在目录，不依赖 cwd。"""
 
@@ -160,11 +729,20 @@ class Config:
             "delete_empty_folders": False,
             "use_exiftool": True,
             "unified_naming": True,
+            "preallocate_copies": True,
+            "max_concurrency": 0,
+            "optimize_for_hdd": "auto",
+            "super_copy_hash_algo": "auto",
+            "super_copy_hash_mmap": True,
+            "super_copy_verify_dest": True,
+            "super_copy_threads": 0,
             "auto_copy": {
                 "enabled": False,
                 "watch_paths": ["/media"],
                 "target_path": "",
                 "poll_interval_sec": 60,
+                "max_concurrent_mounts": 2,
+                "copy_threads": 0,
             },
         }
         if os.path.exists(self.config_file):
@@ -205,37 +783,49 @@ class Config:
             "delete_empty_folders": getattr(self, "delete_empty_folders", False),
             "use_exiftool": getattr(self, "use_exiftool", True),
             "unified_naming": getattr(self, "unified_naming", True),
-            "auto_copy": getattr(self, "auto_copy", {"enabled": False, "watch_paths": ["/media"], "target_path": "", "poll_interval_sec": 60}),
+            "preallocate_copies": getattr(self, "preallocate_copies", True),
+            "max_concurrency": getattr(self, "max_concurrency", 0),
+            "optimize_for_hdd": getattr(self, "optimize_for_hdd", "auto"),
+            "super_copy_hash_algo": getattr(self, "super_copy_hash_algo", "auto"),
+            "super_copy_hash_mmap": getattr(self, "super_copy_hash_mmap", True),
+            "super_copy_verify_dest": getattr(self, "super_copy_verify_dest", True),
+            "super_copy_threads": getattr(self, "super_copy_threads", 0),
+            "auto_copy": getattr(self, "auto_copy", {"enabled": False, "watch_paths": ["/media"], "target_path": "", "poll_interval_sec": 60, "max_concurrent_mounts": 2, "copy_threads": 0}),
         }
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            json.dump(cfg, f, ensure_ascii=False, indent=2)
+        # 界面在后台线程保存，写临时文件再替换，避免与读取方或退出时的中断撞上半截文件
+        _write_json_atomic(Path(self.config_file), cfg, indent=2)
 
 
 def _sanitize_folder_name(name: str) -> str:
     """替换不宜做目录名的字符."""
     if not name or not name.strip():
         return "未知设备"
-    s = re.sub(r'[<>:"/\\|?*]', "_", name.strip())
-    return s[:80] if len(s) > 80 else s
-
-
-def _get_resolution(path: Path, media_type: str, use_exiftool: bool = True) -> Tuple[Optional[int], Optional[int]]:
-    """读取宽高（像素）。返回 (width, height)，失败为 (None, None)。"""
-    if media_type == "image" and Image:
-        try:
-            with Image.open(path) as img:
-                w, h = img.size
-                return (w, h)
-        except Exception:
-            pass
+    return name.strip().translate(_SANITIZE_TABLE)[:80]
+
+
+def _get_resolution(
+    path: Path, media_type: str, use_exiftool: bool = True,
+    exif_reader: Optional[Callable[[Path], Dict[str, str]]] = None,
+    pil_reader: Optional[Callable[[Path], Optional[_PillowInfo]]] = None,
+) -> Tuple[Optional[int], Optional[int]]:
+    """读取宽高（像素）。返回 (width, height)，失败为 (None, None)。
+    exif_reader / pil_reader 提供时用其（带缓存）代替单独调用 exiftool / 重新打开图片。"""
+    if media_type == "image":
+        pil = pil_reader(path) if pil_reader else _pillow_info(path)
+        if pil and pil.size:
+            return pil.size
     if use_exiftool:
-        m = _exiftool_get(path, ["ImageWidth", "ImageHeight", "VideoFrameWidth", "VideoFrameHeight"], True)
+        if exif_reader:
+            m = exif_reader(path)
+        else:
+            m = _exiftool_get(path, ["ImageWidth", "ImageHeight", "VideoFrameWidth", "VideoFrameHeight"], True)
         for wkey, hkey in [("ImageWidth", "ImageHeight"), ("VideoFrameWidth", "VideoFrameHeight")]:
             w = m.get(wkey, "").strip()
             h = m.get(hkey, "").strip()
             if w.isdigit() and h.isdigit():
                 return (int(w), int(h))
-    if createParser and extractMetadata and media_type in ("video", "panoramic_video"):
+    createParser, extractMetadata = _hachoir() if media_type in ("video", "panoramic_video") else (None, None)
+    if createParser and extractMetadata:
         try:
             parser = createParser(str(path))
             if parser:
@@ -248,22 +838,26 @@ def _get_resolution(path: Path, media_type: str, use_exiftool: bool = True) -> T
     return (None, None)
 
 
-def _get_frame_rate(path: Path, media_type: str, use_exiftool: bool = True) -> str:
+def _get_frame_rate(
+    path: Path, media_type: str, use_exiftool: bool = True,
+    exif_reader: Optional[Callable[[Path], Dict[str, str]]] = None,
+) -> str:
     """读取帧率，返回如 60fps、30fps，非视频或失败返回空字符串。"""
     if media_type not in ("video", "panoramic_video"):
         return ""
     if use_exiftool:
-        m = _exiftool_get(path, ["VideoFrameRate", "FrameRate"], True)
+        m = exif_reader(path) if exif_reader else _exiftool_get(path, ["VideoFrameRate", "FrameRate"], True)
         for key in ("VideoFrameRate", "FrameRate"):
             v = m.get(key, "").strip()
             if not v:
                 continue
             v = v.replace(",", ".")
-            if re.match(r"^\d+(\.\d+)?$", v):
+            if _FPS_NUMERIC_RE.match(v):
                 return f"{int(float(v))}fps"
-            match = re.search(r"(\d+(?:\.\d+)?)\s*fps?", v, re.I)
+            match = _FPS_EXTRACT_RE.search(v)
             if match:
                 return f"{int(float(match.group(1)))}fps"
+    createParser, extractMetadata = _hachoir()
     if createParser and extractMetadata:
         try:
             parser = createParser(str(path))
@@ -284,63 +878,269 @@ def _is_date_like_folder(name: str) -> bool:
     if not name or len(name) > 20:
         return False
     s = name.strip()
-    if re.match(r"^\d{8}$", s):
+    if _DATE_COMPACT_RE.match(s):
         return True
-    if re.match(r"^\d{4}-\d{2}-\d{2}$", s):
+    if _DATE_DASH_RE.match(s):
         return True
-    if re.match(r"^\d{4}/\d{2}/\d{2}$", s):
+    if _DATE_SLASH_RE.match(s):
         return True
     return False
 
 
-def _exiftool_get(path: Path, tags: List[str], use_exiftool: bool) -> Dict[str, str]:
-    """用 exiftool 读取指定 tag，返回 {tag: value}。"""
-    if not use_exiftool or not path.exists():
-        return {}
-    try:
-        out = subprocess.run(
-            ["exiftool", "-s", "-json", "-" + ",".join(tags), str(path)],
-            capture_output=True,
-            text=True,
-            timeout=10,
-            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
+# 整理流程用到的全部 exiftool 标签：每个文件只调用一次 exiftool 一并读取（见 MediaOrganizer._exif_all）
+EXIFTOOL_ALL_TAGS = [
+    "DateTimeOriginal", "CreateDate", "MediaCreateDate", "Make", "Model",
+    "ProjectionType", "StitchingSoftware", "ImageWidth", "ImageHeight",
+    "VideoFrameWidth", "VideoFrameHeight", "VideoFrameRate", "FrameRate",
+]
+METADATA_CACHE_MAX = 50000  # 持久化的 exiftool 结果最多保留条数（按最近使用）
+EXIF_CACHE_SIZE = 256  # 只需覆盖同一文件的几次查询，限制条数避免大目录占用内存
+
+
+EXIFTOOL_TIMEOUT = 10  # 单次查询超时（秒），超时则结束该 exiftool 进程
+EXIFTOOL_MAX_WORKERS = max(1, min(8, os.cpu_count() or 1))  # 常驻 exiftool 进程上限，超出的查询排队等待
+_CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0  # Windows 下不弹出控制台窗口
+
+
+class _ExifToolWorker:
+    """常驻 exiftool 进程（-stay_open 批处理模式）：参数经 stdin 逐行传入，以 {readyN} 标记一次查询结束。"""
+
+    def __init__(self):
+        self._proc = subprocess.Popen(
+            ["exiftool", "-stay_open", "True", "-@", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            creationflags=_CREATION_FLAGS,
         )
-        if out.returncode != 0 or not out.stdout:
+        self._seq = 0
+        self._broken = False
+        # 单独线程读 stdout：超时后即使 exiftool 的子进程仍占着管道，查询方也能按时返回
+        self._lines: "queue.Queue[bytes]" = queue.Queue()
+        threading.Thread(target=self._read_stdout, daemon=True).start()
+
+    def _read_stdout(self):
+        for line in iter(self._proc.stdout.readline, b""):
+            self._lines.put(line)
+        self._lines.put(b"")
+
+    @property
+    def alive(self) -> bool:
+        return not self._broken and self._proc.poll() is None
+
+    def execute(self, args: List[str]) -> str:
+        self._seq += 1
+        # 参数与路径统一按 UTF-8 传入，Windows 下中文路径同样可用
+        lines = ["-charset", "filename=utf8", *args, f"-execute{self._seq}", ""]
+        sentinel = f"{{ready{self._seq}}}".encode("ascii")
+        deadline = time.monotonic() + EXIFTOOL_TIMEOUT
+        try:
+            self._proc.stdin.write("\n".join(lines).encode("utf-8"))
+            self._proc.stdin.flush()
+            out = []
+            while True:
+                try:
+                    line = self._lines.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    raise OSError("exiftool 查询超时")
+                if not line:
+                    raise OSError("exiftool 进程已退出")
+                if line.rstrip() == sentinel:
+                    break
+                out.append(line)
+        except OSError:
+            self._broken = True
+            raise
+        return b"".join(out).decode("utf-8", "replace")
+
+    def close(self):
+        if self._broken:
+            self._proc.kill()
+            return
+        try:
+            self._proc.stdin.write(b"-stay_open\nFalse\n")
+            self._proc.stdin.flush()
+            self._proc.wait(timeout=2)
+        except Exception:
+            self._proc.kill()
+
+
+class _ExifToolPool:
+    """按需启动的 exiftool 常驻进程池：每个并发查询占用一个进程，用完放回复用；程序退出时统一关闭。
+    进程数不超过 EXIFTOOL_MAX_WORKERS（exiftool 为 CPU 密集的 Perl 进程，整理时的识别线程数远多于核数）。"""
+
+    def __init__(self, max_workers: int = EXIFTOOL_MAX_WORKERS):
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._idle: List[_ExifToolWorker] = []
+        self._all: List[_ExifToolWorker] = []
+        self.available = True  # 未安装 exiftool 时置 False，不再尝试启动
+
+    def execute(self, args: List[str]) -> Optional[str]:
+        if not self.available:
+            return None
+        with self._slots:
+            return self._execute(args)
+
+    def _execute(self, args: List[str]) -> Optional[str]:
+        with self._lock:
+            worker = self._idle.pop() if self._idle else None
+        if worker is None:
+            if not self.available:
+                return None
+            try:
+                worker = _ExifToolWorker()
+            except OSError as e:
+                self.available = False
+                logger.debug("无法启动 exiftool: %s", e)
+                return None
+            with self._lock:
+                self._all.append(worker)
+        try:
+            return worker.execute(args)
+        except OSError:
+            worker.close()
+            with self._lock:
+                self._all.remove(worker)
+            raise
+        finally:
+            if worker.alive:
+                with self._lock:
+                    self._idle.append(worker)
+
+    def close(self):
+        with self._lock:
+            workers, self._all, self._idle = self._all, [], []
+        for w in workers:
+            w.close()
+
+
+_exiftool_pool = _ExifToolPool()
+atexit.register(_exiftool_pool.close)
+
+# 仍存活的整理器：退出时统一写入各自未落盘的记录（弱引用，不延长其生命周期）
+_live_organizers: "weakref.WeakSet[MediaOrganizer]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_organizers():
+    for organizer in list(_live_organizers):
+        organizer._flush_on_exit()
+
+
+def _exiftool_query(path: Path, tags: List[str]) -> Optional[Dict[str, str]]:
+    """用 exiftool 读取指定 tag，返回 {tag: value}；exiftool 不可用或查询失败（超时等）时返回 None。"""
+    if "\n" in str(path):
+        # 批处理模式按行传参，含换行的路径无法传入
+        return None
+    try:
+        out = _exiftool_pool.execute(["-s", "-json", *("-" + t for t in tags), str(path)])
+        if out is None:
+            return None
+        if not out:
             return {}
-        data = json.loads(out.stdout)
+        data = json.loads(out)
         if not data or not isinstance(data[0], dict):
             return {}
         return {k: str(v).strip() for k, v in data[0].items() if v is not None and str(v).strip()}
-    except (FileNotFoundError, subprocess.TimeoutExpired, json.JSONDecodeError) as e:
+    except (OSError, json.JSONDecodeError) as e:
         logger.debug("exiftool 读取失败 %s: %s", path.name, e)
+        return None
+
+
+def _exiftool_get(path: Path, tags: List[str], use_exiftool: bool) -> Dict[str, str]:
+    """用 exiftool 读取指定 tag，返回 {tag: value}。"""
+    if not use_exiftool or not path.exists():
         return {}
+    return _exiftool_query(path, tags) or {}
 
 
-def _date_from_exif_pillow(path: Path) -> Optional[datetime]:
-    """从图片 EXIF 取拍摄时间（PIL）。"""
+# 标准 EXIF 标签号：Make/Model/DateTime 在主 IFD，拍摄/数字化时间在 Exif 子 IFD
+_EXIF_MAKE = 271
+_EXIF_MODEL = 272
+_EXIF_DATETIME = 306
+_EXIF_IFD_POINTER = 0x8769
+_EXIF_DATETIME_ORIGINAL = 36867
+_EXIF_DATETIME_DIGITIZED = 36868
+
+
+def _write_json_atomic(path: Path, data, indent: Optional[int] = None):
+    """整体序列化后一次写入临时文件再替换 path，避免中断时损坏。
+    json.dumps 在无缩进时走 C 编码器，比逐块写出的 json.dump 快得多。
+    临时文件名带进程号与线程号，多个线程/进程同时保存同一文件时互不覆盖（以最后替换者为准）；
+    不用 tempfile 是为了让结果文件保持按 umask 创建的常规权限。"""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    text = json.dumps(data, ensure_ascii=False, indent=indent)
+    try:
+        with open(tmp, "w", encoding="utf-8", buffering=IO_BUF) as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _exif_text(value) -> str:
+    """EXIF 值转为字符串，缺失或为空时返回空串。"""
+    if not value:
+        return ""
+    return value if isinstance(value, str) else str(value)
+
+
+def _pillow_info(path: Path) -> Optional[_PillowInfo]:
+    """用 PIL 打开图片一次，读取尺寸与 EXIF 中的日期、Make、Model。无法打开时返回 None。"""
+    Image = _pil()
     if not Image:
         return None
     try:
         with Image.open(path) as img:
-            exif = img.getexif() or {}
-            for tag_id, value in exif.items():
-                tag = TAGS.get(tag_id, tag_id)
-                if tag in ("DateTimeOriginal", "DateTimeDigitized", "DateTime"):
-                    if not value:
-                        continue
-                    s = value if isinstance(value, str) else str(value)
-                    for fmt in ("%Y:%m:%d %H:%M:%S", "%Y-%m-%d %H:%M:%S"):
-                        try:
-                            return datetime.strptime(s.replace("-", ":").replace(" ", " ")[:19], fmt)
-                        except ValueError:
-                            continue
+            info = _PillowInfo(size=img.size)
+            try:
+                exif = img.getexif()
+                sub = exif.get_ifd(_EXIF_IFD_POINTER) if exif else {}
+            except Exception as e:
+                logger.debug("PIL EXIF 解析失败 %s: %s", path.name, e)
+                return info
+            if not exif:
+                return info
+            # 按 拍摄时间 → 数字化时间 → 修改时间 的优先级
+            for text in (
+                _exif_text(sub.get(_EXIF_DATETIME_ORIGINAL) or exif.get(_EXIF_DATETIME_ORIGINAL)),
+                _exif_text(sub.get(_EXIF_DATETIME_DIGITIZED) or exif.get(_EXIF_DATETIME_DIGITIZED)),
+                _exif_text(exif.get(_EXIF_DATETIME)),
+            ):
+                if text:
+                    info.dates.append(text)
+            info.make = _exif_text(exif.get(_EXIF_MAKE)).strip()
+            info.model = _exif_text(exif.get(_EXIF_MODEL)).strip()
+            return info
     except Exception as e:
-        logger.debug("PIL EXIF 日期解析失败 %s: %s", path.name, e)
+        logger.debug("PIL 打开图片失败 %s: %s", path.name, e)
+        return None
+
+
+def _date_from_exif_pillow(
+    path: Path, pil_reader: Optional[Callable[[Path], Optional[_PillowInfo]]] = None
+) -> Optional[datetime]:
+    """从图片 EXIF 取拍摄时间（PIL）。"""
+    pil = pil_reader(path) if pil_reader else _pillow_info(path)
+    if not pil:
+        return None
+    for s in pil.dates:
+        for fmt in ("%Y:%m:%d %H:%M:%S", "%Y-%m-%d %H:%M:%S"):
+            try:
+                return datetime.strptime(s.replace("-", ":").replace(" ", " ")[:19], fmt)
+            except ValueError:
+                continue
     return None
 
 
 def _date_from_hachoir(path: Path) -> Optional[datetime]:
     """从视频/音频用 hachoir 取创建/录制时间."""
+    createParser, extractMetadata = _hachoir()
     if not createParser or not extractMetadata:
         return None
     try:
@@ -367,42 +1167,33 @@ def _date_from_hachoir(path: Path) -> Optional[datetime]:
     return None
 
 
-def _device_from_exif_pillow(path: Path) -> str:
+def _device_from_exif_pillow(
+    path: Path, pil_reader: Optional[Callable[[Path], Optional[_PillowInfo]]] = None
+) -> str:
     """从图片 EXIF 取设备（Make + Model）。"""
-    if not Image:
+    pil = pil_reader(path) if pil_reader else _pillow_info(path)
+    if not pil:
         return ""
-    try:
-        with Image.open(path) as img:
-            exif = img.getexif() or {}
-            make = model = ""
-            for tag_id, value in exif.items():
-                tag = TAGS.get(tag_id, tag_id)
-                if tag == "Make" and value:
-                    make = (value if isinstance(value, str) else str(value)).strip()
-                elif tag == "Model" and value:
-                    model = (value if isinstance(value, str) else str(value)).strip()
-            if make or model:
-                return f"{make} {model}".strip()
-    except Exception as e:
-        logger.debug("PIL EXIF 设备解析失败 %s: %s", path.name, e)
-    return ""
+    return f"{pil.make} {pil.model}".strip()
 
 
 def _is_panoramic_by_path(path: Path, video_ext: Set[str], panoramic_ext: Set[str]) -> bool:
-    ext = path.suffix.lower()
+    ext = _name_suffix(path.name).lower()
     if ext in panoramic_ext:
         return True
     if ext not in video_ext:
         return False
-    name = path.stem.lower()
-    if "360" in name or "panoram" in name or "theta" in name or "insta360" in name:
-        return True
-    return False
+    return _PANO_HINT_RE.search(path.stem) is not None
 
 
-def _is_panoramic_by_metadata(path: Path, use_exiftool: bool) -> bool:
+def _is_panoramic_by_metadata(
+    path: Path, use_exiftool: bool, exif_reader: Optional[Callable[[Path], Dict[str, str]]] = None
+) -> bool:
     """通过 exiftool 或 XMP 判断是否全景/360."""
-    m = _exiftool_get(path, ["ProjectionType", "StitchingSoftware", "Make", "Model"], use_exiftool)
+    if exif_reader and use_exiftool:
+        m = exif_reader(path)
+    else:
+        m = _exiftool_get(path, ["ProjectionType", "StitchingSoftware", "Make", "Model"], use_exiftool)
     if m.get("ProjectionType", "").lower() in ("equirectangular", "equirectangular "):
         return True
     if "360" in m.get("Make", "") or "360" in m.get("Model", ""):
@@ -417,43 +1208,422 @@ class MediaOrganizer:
 
     def __init__(self, config: Config):
         self.config = config
-        self.image_ext = set(x.lower() for x in getattr(config, "image_extensions", []))
-        self.video_ext = set(x.lower() for x in getattr(config, "video_extensions", []))
-        self.video_ext |= set(x.lower() for x in VIDEO_EXTENSIONS)
-        self.audio_ext = set(x.lower() for x in getattr(config, "audio_extensions", []))
-        self.leave_ext = set(x.lower() for x in getattr(config, "leave_in_place_extensions", []))
+        self.image_ext = frozenset(x.lower() for x in getattr(config, "image_extensions", []))
+        self.video_ext = frozenset(x.lower() for x in getattr(config, "video_extensions", [])) | VIDEO_EXTENSIONS
+        self.audio_ext = frozenset(x.lower() for x in getattr(config, "audio_extensions", []))
+        self.media_ext = self.image_ext | self.video_ext | self.audio_ext
+        self.leave_ext = frozenset(x.lower() for x in getattr(config, "leave_in_place_extensions", []))
+        self._load_settings()
         self.processed_path = Path(config.config_file).parent / "processed_files.json"
-        self.processed: Set[str] = set()
+        # 已处理记录 = 快照（processed_files.json）+ 追加日志（processed_files.jsonl，每行一个路径）
+        self.processed_journal_path = self.processed_path.with_suffix(".jsonl")
+        self.processed = _PathSet()
+        self._processed_pending: List[str] = []  # 尚未写入追加日志的新记录
+        self._snapshot_count = 0
+        self._journal_count = 0
+        # 并发拷贝（如守护进程多设备同时拷贝）时，已分配但尚未写入的目标路径
+        self._dest_lock = threading.Lock()
+        self._reserved_dests: Set[str] = set()
         self._load_processed()
+        # 超级拷贝已拷贝记录：(目标根, 源设备, 相对路径, 大小, mtime_ns) -> 目标文件，再次拷贝同一源时免去元数据读取与哈希
+        self.copied_index_path = Path(config.config_file).parent / "copied_index.json"
+        # 已拷贝记录 = 快照（copied_index.json）+ 追加日志（copied_index.jsonl，每行一条），与已处理记录相同
+        self.copied_journal_path = self.copied_index_path.with_suffix(".jsonl")
+        self._copied_index: Dict[Tuple[str, str, str, int, int], str] = {}
+        self._copied_lock = threading.Lock()  # 保护 _copied_index 与 _copied_pending
+        self._copied_write_lock = threading.Lock()  # 串行化落盘；写文件时不持有 _copied_lock
+        self._copied_pending: List[list] = []  # 尚未写入追加日志的新记录
+        self._copied_snapshot_count = 0
+        self._copied_journal_count = 0
+        self._load_copied_index()
+        # exiftool 结果持久化：(大小, mtime_ns) 未变的文件再次运行（如先预览再整理）时免去重复查询
+        self.metadata_cache_path = Path(config.config_file).parent / "metadata_cache.json"
+        self._meta_store: Dict[str, Tuple[int, int, Dict[str, str]]] = {}
+        self._meta_store_lock = threading.Lock()
+        self._meta_store_dirty = False
+        self._load_metadata_store()
+        # 按路径缓存单次 exiftool 的全部标签与单次 PIL 读取结果，类型/日期/设备/分辨率/帧率共用
+        self._exif_cache: Dict[str, Dict[str, str]] = {}
+        self._pil_cache: Dict[str, Optional[_PillowInfo]] = {}
+        self._meta_cache_lock = threading.Lock()
+        # 关联文件查找用的目录列表缓存（每个扫描/拷贝会话开始时清空）
+        self._dir_cache: Dict[str, Tuple[Dict[str, List[Path]], List[str]]] = {}
+        self._dir_cache_lock = threading.Lock()
+        self._root_cache: Dict[str, Path] = {}
+        # 本会话已创建（或确认存在）的目标目录
+        self._made_dirs: Set[str] = set()
+        # 同一实例上可并发多个会话（守护进程同时拷贝多个设备）：只有第一个会话开始时清空会话缓存，
+        # 清理空文件夹推迟到最后一个会话结束时进行
+        self._session_lock = threading.Lock()
+        self._active_sessions = 0
+        self._pending_cleanup: Set[Path] = set()
+        # 设备命名模式库只在创建时读取一次，并预先转好大小写
+        self._device_patterns = self._compile_device_patterns(self._load_device_suffixes_db())
+        _live_organizers.add(self)
+
+    def _load_settings(self):
+        """读取每个文件都会用到的配置项到实例属性，识别时不再逐文件 getattr；每个会话开始时重新读取。"""
+        self.use_exiftool = bool(getattr(self.config, "use_exiftool", True))
+        self.unified_naming = bool(getattr(self.config, "unified_naming", True))
+        self.date_format = getattr(self.config, "folder_structure", {}).get("date_format", "%Y-%m-%d")
+        self.unknown_device = getattr(self.config, "device_unknown_name", "未知设备")
+        self.date_fallback = getattr(self.config, "date_fallback", "mtime")
+        self.related_same_stem = bool(getattr(self.config, "related_same_stem", True))
+        self.hash_algo = _resolve_hash_algo(getattr(self.config, "super_copy_hash_algo", "auto"))
+        self.hash_mmap = bool(getattr(self.config, "super_copy_hash_mmap", True))
+        self.verify_dest = bool(getattr(self.config, "super_copy_verify_dest", True))
+
+    def _begin_session(self):
+        """扫描/拷贝会话开始：重新读取配置项并清空按路径的会话缓存，同一实例可跨会话复用。
+        已有会话在进行时沿用其设置与缓存，不清空（须与 _end_session 成对调用）。"""
+        with self._session_lock:
+            self._active_sessions += 1
+            if self._active_sessions > 1:
+                return
+            self._load_settings()
+            with self._dir_cache_lock:
+                self._dir_cache.clear()
+            with self._meta_cache_lock:
+                self._exif_cache.clear()
+                self._pil_cache.clear()
+            self._root_cache.clear()
+            self._made_dirs.clear()
+
+    def _end_session(self, cleanup_root: Optional[Path] = None) -> int:
+        """会话结束。cleanup_root 为需清理空文件夹的目录：其他会话仍在进行时推迟到最后一个会话结束再清理，
+        以免删掉另一会话刚建好、尚未写入文件的目录。返回本次实际删除的空文件夹数。"""
+        with self._session_lock:
+            try:
+                if cleanup_root is not None:
+                    self._pending_cleanup.add(cleanup_root)
+                if self._active_sessions > 1:
+                    return 0
+                removed = 0
+                for root in self._pending_cleanup:
+                    removed += self._remove_empty_dirs(root)
+                self._pending_cleanup.clear()
+                with self._dir_cache_lock:
+                    self._dir_cache.clear()
+                return removed
+            finally:
+                self._active_sessions -= 1
+
+    def _ensure_dir(self, d: Path):
+        """创建目录（含上级）；同一会话内每个目录只调用一次 mkdir，大量文件落入同一日期目录时省去重复的系统调用。"""
+        key = str(d)
+        if key not in self._made_dirs:
+            d.mkdir(parents=True, exist_ok=True)
+            self._made_dirs.add(key)
+
+    def _cached_read(self, cache: Dict, path: Path, read: Callable[[Path], object]):
+        """按路径缓存 read(path) 的结果（含 None），最多保留 EXIF_CACHE_SIZE 条。"""
+        key = str(path.absolute())
+        with self._meta_cache_lock:
+            if key in cache:
+                return cache[key]
+        value = read(path)
+        with self._meta_cache_lock:
+            cache[key] = value
+            while len(cache) > EXIF_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        return value
+
+    def _dir_listing(self, parent: Path) -> Tuple[Dict[str, List[str]], List[str]]:
+        """目录下参与关联判断的文件：({词干: [路径字符串]}, 排序后的词干表)。同一会话内每个目录只读取一次。
+        缓存只存字符串，Path 留到 find_related_files 真正匹配到关联文件时再构造。"""
+        key = str(parent)
+        with self._dir_cache_lock:
+            cached = self._dir_cache.get(key)
+        if cached is not None:
+            return cached
+        paths: List[str] = []
+        try:
+            with os.scandir(parent) as it:
+                for entry in it:
+                    try:
+                        if not entry.is_file():
+                            continue
+                    except OSError:
+                        continue
+                    if not self._leave_name_in_place(entry.name):
+                        paths.append(entry.path)
+        except OSError as e:
+            logger.debug("读取目录失败 %s: %s", parent, e)
+        return self._seed_dir_listing(key, paths)
+
+    def _seed_dir_listing(self, parent: str, paths: List[str]) -> Tuple[Dict[str, List[str]], List[str]]:
+        """用遍历时已得到的文件列表（已排除留在原处的文件）填入 _dir_listing 的缓存。"""
+        by_stem: Dict[str, List[str]] = {}
+        for p in paths:
+            name = os.path.basename(p)
+            by_stem.setdefault(name[:len(name) - len(_name_suffix(name))], []).append(p)
+        listing = (by_stem, sorted(by_stem))
+        with self._dir_cache_lock:
+            self._dir_cache[parent] = listing
+        return listing
+
+    def _forget_listed(self, path: Path):
+        """文件已移走：从所在目录的缓存列表中去掉，不必重新读取整个目录。"""
+        with self._dir_cache_lock:
+            cached = self._dir_cache.get(str(path.parent))
+            if cached is None:
+                return
+            paths = cached[0].get(path.stem)
+            if paths:
+                name = path.name
+                paths[:] = [p for p in paths if os.path.basename(p) != name]
+
+    def _exif_all(self, path: Path) -> Dict[str, str]:
+        """读取 EXIFTOOL_ALL_TAGS（每个文件只调用一次 exiftool），结果按路径缓存。"""
+        return self._cached_read(self._exif_cache, path, self._read_exif_stored)
+
+    def _read_exif_stored(self, path: Path) -> Dict[str, str]:
+        """先查持久化缓存（文件大小与修改时间须一致），未命中再调用 exiftool 并记入缓存。"""
+        key = str(path.absolute())
+        try:
+            st = path.stat()
+        except OSError:
+            return {}
+        with self._meta_store_lock:
+            hit = self._meta_store.pop(key, None)
+            if hit is not None and hit[0] == st.st_size and hit[1] == st.st_mtime_ns:
+                self._meta_store[key] = hit  # 移到末尾，表示最近使用
+                return hit[2]
+            if hit is not None:
+                self._meta_store_dirty = True
+        tags = _exiftool_query(path, EXIFTOOL_ALL_TAGS)
+        if tags is None:
+            return {}
+        with self._meta_store_lock:
+            self._meta_store[key] = (st.st_size, st.st_mtime_ns, tags)
+            self._meta_store_dirty = True
+        return tags
+
+    def _moved_metadata(self, src: Path, dest: Path):
+        """文件移动后缓存条目改用新路径（移动不改变大小与修改时间），对整理后的目录再次运行时仍可命中。"""
+        with self._meta_store_lock:
+            hit = self._meta_store.pop(str(src.absolute()), None)
+            if hit is not None:
+                self._meta_store[str(dest.absolute())] = hit
+                self._meta_store_dirty = True
+
+    def _read_metadata_store(self) -> Dict[str, Tuple[int, int, Dict[str, str]]]:
+        if self.metadata_cache_path.exists():
+            try:
+                with open(self.metadata_cache_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                # 标签列表变化后旧结果不完整，整体作废
+                if data.get("tags") == EXIFTOOL_ALL_TAGS:
+                    return {p: (int(size), int(mtime), tags) for p, size, mtime, tags in data.get("entries", [])}
+            except Exception as e:
+                logger.warning("加载元数据缓存失败: %s", e)
+        return {}
+
+    def _load_metadata_store(self):
+        self._meta_store = self._read_metadata_store()
+
+    def merge_metadata_store(self):
+        """并入其他进程（如界面的扫描子进程）此后写入 metadata_cache.json 的条目，
+        避免本实例下次 save_metadata_store 用内存中的旧内容把它们覆盖掉；同一路径以内存中的为准。"""
+        disk = self._read_metadata_store()
+        with self._meta_store_lock:
+            disk.update(self._meta_store)
+            self._meta_store = disk
+
+    def save_metadata_store(self):
+        """写入 exiftool 结果缓存（只保留最近使用的 METADATA_CACHE_MAX 条；先写临时文件再替换）。"""
+        with self._meta_store_lock:
+            if not self._meta_store_dirty:
+                return
+            if len(self._meta_store) > METADATA_CACHE_MAX:
+                self._meta_store = dict(list(self._meta_store.items())[-METADATA_CACHE_MAX:])
+            entries = [[p, size, mtime, tags] for p, (size, mtime, tags) in self._meta_store.items()]
+            self._meta_store_dirty = False
+        try:
+            _write_json_atomic(self.metadata_cache_path, {"tags": EXIFTOOL_ALL_TAGS, "entries": entries})
+        except Exception as e:
+            logger.warning("保存元数据缓存失败: %s", e)
+
+    def _pillow_all(self, path: Path) -> Optional[_PillowInfo]:
+        """用 PIL 打开图片一次读取尺寸与 EXIF，结果按路径缓存。"""
+        return self._cached_read(self._pil_cache, path, _pillow_info)
 
     def _load_processed(self):
+        paths: List[str] = []
         if self.processed_path.exists():
             try:
                 with open(self.processed_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                self.processed = set(data.get("paths", []))
+                    paths = json.load(f).get("paths", [])
             except Exception as e:
                 logger.warning("加载已处理记录失败: %s", e)
+        self._snapshot_count = len(paths)
+        if self.processed_journal_path.exists():
+            try:
+                with open(self.processed_journal_path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            paths.append(json.loads(line))
+                            self._journal_count += 1
+                        except ValueError:
+                            pass  # 中断时写了一半的行
+            except OSError as e:
+                logger.warning("加载已处理记录失败: %s", e)
+        self.processed = _PathSet(paths)
 
     def save_processed(self, force: bool = False):
-        if not force and not self.processed:
+        """写入已处理记录：新记录追加到 processed_files.jsonl，不再每次重写整个文件。
+        非强制时累计 PROCESSED_SAVE_EVERY 条才落盘，中途中断最多丢失一批记录；
+        追加日志条数超过快照时合并进快照（总写入量仍与记录数成线性）。"""
+        if not self._processed_pending or (not force and len(self._processed_pending) < PROCESSED_SAVE_EVERY):
             return
+        pending, self._processed_pending = self._processed_pending, []
         try:
-            with open(self.processed_path, "w", encoding="utf-8") as f:
-                json.dump({"paths": list(self.processed)}, f, ensure_ascii=False, indent=2)
+            with open(self.processed_journal_path, "a", encoding="utf-8", buffering=IO_BUF) as f:
+                f.write("".join(json.dumps(k, ensure_ascii=False) + "\n" for k in pending))
+            self._journal_count += len(pending)
         except Exception as e:
             logger.warning("保存已处理记录失败: %s", e)
+            self._processed_pending[:0] = pending
+            return
+        if self._journal_count > self._snapshot_count:
+            self._compact_processed()
+
+    def _compact_processed(self):
+        """把全部记录写成新快照（先写临时文件再替换）并清空追加日志；两步之间中断只会留下重复记录。"""
+        try:
+            paths = list(self.processed)
+            _write_json_atomic(self.processed_path, {"paths": paths}, indent=2)
+            open(self.processed_journal_path, "w", encoding="utf-8").close()
+            self._snapshot_count, self._journal_count = len(paths), 0
+        except Exception as e:
+            logger.warning("合并已处理记录失败: %s", e)
+
+    def _mark_processed(self, key: str):
+        if key not in self.processed:
+            self.processed.add(key)
+            self._processed_pending.append(key)
+
+    def _flush_on_exit(self):
+        """进程退出时写入尚未落盘的已处理/已拷贝记录与元数据缓存。"""
+        self.save_processed(force=True)
+        self.save_copied_index(force=True)
+        self.save_metadata_store()
+
+    def _load_copied_index(self):
+        entries: List[list] = []
+        if self.copied_index_path.exists():
+            try:
+                with open(self.copied_index_path, "r", encoding="utf-8") as f:
+                    entries = json.load(f).get("entries", [])
+            except Exception as e:
+                logger.warning("加载已拷贝记录失败: %s", e)
+        self._copied_snapshot_count = len(entries)
+        if self.copied_journal_path.exists():
+            try:
+                with open(self.copied_journal_path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            entries.append(json.loads(line))
+                            self._copied_journal_count += 1
+                        except ValueError:
+                            pass  # 中断时写了一半的行
+            except OSError as e:
+                logger.warning("加载已拷贝记录失败: %s", e)
+        index = {}
+        for entry in entries:
+            try:
+                t, src, rel, size, mtime, dest = entry
+                index[(t, src, rel, int(size), int(mtime))] = dest
+            except (TypeError, ValueError):
+                continue
+        self._copied_index = index
+
+    def save_copied_index(self, force: bool = False):
+        """写入已拷贝记录：新记录追加到 copied_index.jsonl，不再每批重写整个文件；追加日志条数超过快照时合并进快照。
+        非强制时累计 COPIED_INDEX_SAVE_EVERY 条才落盘，且另一线程正在落盘时直接返回；
+        写文件不持有 _copied_lock，拷贝线程记录新条目时不必等待。"""
+        with self._copied_lock:
+            if not self._copied_pending or (not force and len(self._copied_pending) < COPIED_INDEX_SAVE_EVERY):
+                return
+        if not self._copied_write_lock.acquire(blocking=force):
+            return
+        try:
+            with self._copied_lock:
+                pending, self._copied_pending = self._copied_pending, []
+            if not pending:
+                return
+            try:
+                with open(self.copied_journal_path, "a", encoding="utf-8", buffering=IO_BUF) as f:
+                    f.write("".join(json.dumps(e, ensure_ascii=False) + "\n" for e in pending))
+                self._copied_journal_count += len(pending)
+            except Exception as e:
+                logger.warning("保存已拷贝记录失败: %s", e)
+                with self._copied_lock:
+                    self._copied_pending[:0] = pending
+                return
+            if self._copied_journal_count > self._copied_snapshot_count:
+                self._compact_copied_index()
+        finally:
+            self._copied_write_lock.release()
+
+    def _compact_copied_index(self):
+        """把全部已拷贝记录写成新快照并清空追加日志（调用方持有 _copied_write_lock）。
+        只在复制字典时持有 _copied_lock；之后新增的记录仍在 _copied_pending 中，不会因清空追加日志而丢失。"""
+        with self._copied_lock:
+            entries = [list(k) + [v] for k, v in self._copied_index.items()]
+        try:
+            _write_json_atomic(self.copied_index_path, {"entries": entries})
+            open(self.copied_journal_path, "w", encoding="utf-8").close()
+            self._copied_snapshot_count, self._copied_journal_count = len(entries), 0
+        except Exception as e:
+            logger.warning("合并已拷贝记录失败: %s", e)
+
+    def _copied_key(
+        self, target_key: str, source_key: str, source_root: Path, path: Path
+    ) -> Optional[Tuple[str, str, str, int, int]]:
+        """source_key 标识源设备（有卷 UUID 时为 "uuid:<UUID>"，否则为源根路径），同一张卡换了挂载点仍能命中记录。"""
+        try:
+            st = path.stat()
+            rel = str(path.relative_to(source_root))
+        except (OSError, ValueError):
+            return None
+        return (target_key, source_key, rel, st.st_size, st.st_mtime_ns)
+
+    def _is_copied(self, key) -> bool:
+        """源文件（大小、修改时间未变）此前已拷贝到同一目标，且目标文件仍在。"""
+        if key is None:
+            return False
+        dest = self._copied_index.get(key)
+        return dest is not None and os.path.exists(dest)
+
+    def _mark_copied(self, key, dest: Path):
+        if key is None:
+            return
+        with self._copied_lock:
+            self._copied_index[key] = str(dest)
+            self._copied_pending.append(list(key) + [str(dest)])
+        self.save_copied_index()
 
     def should_leave_in_place(self, filepath: Path) -> bool:
-        ext = filepath.suffix.lower()
-        if ext in self.leave_ext:
+        return self._leave_name_in_place(filepath.name)
+
+    def _leave_name_in_place(self, name: str) -> bool:
+        if _name_suffix(name).lower() in self.leave_ext:
             return True
-        if "." in filepath.name and filepath.name.lower().endswith((".fg.op", ".fg.ed")):
+        if "." in name and name.lower().endswith((".fg.op", ".fg.ed")):
             return True
         return False
 
+    def is_media_file(self, path: Path) -> bool:
+        """仅按扩展名判断是否媒体文件，不读取元数据（收集、计数用；具体类型由 get_media_type 判断）。"""
+        return self._is_media_name(path.name)
+
+    def _is_media_name(self, name: str) -> bool:
+        ext = _name_suffix(name).lower()
+        return ext in self.media_ext
+
     def get_media_type(self, path: Path) -> Optional[str]:
-        ext = path.suffix.lower()
+        ext = _name_suffix(path.name).lower()
         if ext in self.image_ext:
             return "image"
         if ext in self.audio_ext:
@@ -462,15 +1632,15 @@ class MediaOrganizer:
             return None
         if _is_panoramic_by_path(path, self.video_ext, PANORAMIC_EXTENSIONS):
             return "panoramic_video"
-        if getattr(self.config, "use_exiftool", True) and _is_panoramic_by_metadata(path, True):
+        if self.use_exiftool and _is_panoramic_by_metadata(path, True, self._exif_all):
             return "panoramic_video"
         return "video"
 
     def get_shoot_date(self, path: Path, media_type: str) -> Optional[datetime]:
         if media_type == "image":
-            dt = _date_from_exif_pillow(path)
-            if not dt and getattr(self.config, "use_exiftool", True):
-                m = _exiftool_get(path, ["DateTimeOriginal", "CreateDate"], True)
+            dt = _date_from_exif_pillow(path, self._pillow_all)
+            if not dt and self.use_exiftool:
+                m = self._exif_all(path)
                 for key in ("DateTimeOriginal", "CreateDate"):
                     if key in m and m[key]:
                         s = m[key].replace("-", ":").replace(" ", " ")[:19]
@@ -482,8 +1652,8 @@ class MediaOrganizer:
             if dt:
                 return dt
         else:
-            if getattr(self.config, "use_exiftool", True):
-                m = _exiftool_get(path, ["CreateDate", "DateTimeOriginal", "MediaCreateDate"], True)
+            if self.use_exiftool:
+                m = self._exif_all(path)
                 for key in ("CreateDate", "DateTimeOriginal", "MediaCreateDate"):
                     if key in m and m[key]:
                         s = m[key].replace("-", ":").replace(" ", " ")[:19]
@@ -494,7 +1664,7 @@ class MediaOrganizer:
             dt = _date_from_hachoir(path)
             if dt:
                 return dt
-        fallback = getattr(self.config, "date_fallback", "mtime")
+        fallback = self.date_fallback
         if fallback == "mtime":
             try:
                 mtime = path.stat().st_mtime
@@ -515,43 +1685,52 @@ class MediaOrganizer:
             logger.warning("加载设备后缀名库失败: %s", e)
             return {}
 
+    @staticmethod
+    def _compile_device_patterns(db: Dict) -> List[Tuple[str, Tuple[str, ...], List[str], Set[str]]]:
+        """设备库转为 [(设备名, 大写前缀, 大写包含串, 扩展名集合)]，按库中顺序匹配。"""
+        return [
+            (
+                device_name,
+                tuple(p.upper() for p in pattern.get("filename_prefixes", [])),
+                [c.upper() for c in pattern.get("filename_contains", [])],
+                set(pattern.get("extensions", [])),
+            )
+            for device_name, pattern in db.get("device_patterns", {}).items()
+        ]
+
     def _device_from_filename_pattern(self, path: Path) -> Optional[str]:
         """通过文件名前缀或包含匹配设备库识别设备。文件名中带 DJI 的均视为大疆拍摄。"""
-        db = self._load_device_suffixes_db()
-        patterns = db.get("device_patterns", {})
-        if not patterns:
+        if not self._device_patterns:
             return None
         filename = path.stem.upper()
         ext = path.suffix.lower()
-        for device_name, pattern in patterns.items():
-            extensions = pattern.get("extensions", [])
-            ext_ok = not extensions or ext in extensions
+        for device_name, prefixes, contains, extensions in self._device_patterns:
+            if extensions and ext not in extensions:
+                continue
             # 前缀匹配
-            for prefix in pattern.get("filename_prefixes", []):
-                if filename.startswith(prefix.upper()) and ext_ok:
-                    return device_name
+            if prefixes and filename.startswith(prefixes):
+                return device_name
             # 包含匹配（如文件名中带 DJI 的均视为大疆）
-            for sub in pattern.get("filename_contains", []):
-                if sub.upper() in filename and ext_ok:
-                    return device_name
+            if any(sub in filename for sub in contains):
+                return device_name
         return None
 
     def get_device(self, path: Path, media_type: str) -> str:
-        unknown = getattr(self.config, "device_unknown_name", "未知设备")
+        unknown = self.unknown_device
         if media_type not in ("image", "video", "panoramic_video"):
             return unknown
         # 文件名含 DJI、大疆 或扩展名为 .LRF 的均为大疆拍摄，优先识别
         stem = path.stem
         stem_upper = stem.upper()
-        ext_lower = path.suffix.lower()
+        ext_lower = _name_suffix(path.name).lower()
         if "DJI" in stem_upper or "大疆" in stem:
             return "大疆"
         if media_type in ("video", "panoramic_video") and ext_lower == ".lrf":
             return "大疆"
         if media_type == "image":
-            dev = _device_from_exif_pillow(path)
-            if not dev and getattr(self.config, "use_exiftool", True):
-                m = _exiftool_get(path, ["Make", "Model"], True)
+            dev = _device_from_exif_pillow(path, self._pillow_all)
+            if not dev and self.use_exiftool:
+                m = self._exif_all(path)
                 make = m.get("Make", "").strip()
                 model = m.get("Model", "").strip()
                 dev = f"{make} {model}".strip()
@@ -559,8 +1738,8 @@ class MediaOrganizer:
                 return _sanitize_folder_name(dev)
             dev = self._device_from_filename_pattern(path)
             return _sanitize_folder_name(dev) if dev else unknown
-        if getattr(self.config, "use_exiftool", True):
-            m = _exiftool_get(path, ["Make", "Model"], True)
+        if self.use_exiftool:
+            m = self._exif_all(path)
             make = m.get("Make", "").strip()
             model = m.get("Model", "").strip()
             dev = f"{make} {model}".strip()
@@ -569,25 +1748,28 @@ class MediaOrganizer:
         dev = self._device_from_filename_pattern(path)
         return _sanitize_folder_name(dev) if dev else unknown
 
-    def find_related_files(self, primary: Path, media_type: str) -> List[Path]:
+    def find_related_files(self, primary: Path, media_type: Optional[str] = None) -> List[Path]:
         """与主文件同目录、同词干（或高度关联）的文件一并移动."""
-        if not getattr(self.config, "related_same_stem", True):
+        if not self.related_same_stem:
             return []
         stem = primary.stem
-        parent = primary.parent
-        related = []
-        for f in parent.iterdir():
-            if not f.is_file() or f == primary:
-                continue
-            if self.should_leave_in_place(f):
-                continue
-            if f.stem == stem:
-                related.append(f)
-            elif stem.startswith(f.stem + "_") or f.stem.startswith(stem + "_"):
-                related.append(f)
-            elif stem.startswith(f.stem + " ") or f.stem.startswith(stem + " "):
-                related.append(f)
-        return related
+        by_stem, stems = self._dir_listing(primary.parent)
+        matched = {stem} if stem in by_stem else set()
+        for sep in ("_", " "):
+            # 其他词干以 stem_ 开头：在排序词干表中二分定位前缀区间
+            prefix = stem + sep
+            i = bisect.bisect_left(stems, prefix)
+            while i < len(stems) and stems[i].startswith(prefix):
+                matched.add(stems[i])
+                i += 1
+            # stem 以 其他词干_ 开头：逐个分隔符位置截取前缀查表
+            pos = stem.find(sep)
+            while pos > 0:
+                if stem[:pos] in by_stem:
+                    matched.add(stem[:pos])
+                pos = stem.find(sep, pos + 1)
+        name = primary.name
+        return [Path(f) for s in sorted(matched) for f in by_stem[s] if os.path.basename(f) != name]
 
     def build_target_dir(self, info: MediaInfo, output_root: Path) -> Path:
         fs = getattr(self.config, "folder_structure", {})
@@ -611,63 +1793,135 @@ class MediaOrganizer:
 
     def _build_unified_basename(self, device: str, date_str: str, resolution_str: str, fps_str: str) -> str:
         """统一命名格式：设备名_拍摄日期[_分辨率][_帧率]，分辨率/帧率未知则不填。"""
-        safe = re.sub(r'[<>:"/\\|?*\s]+', "_", str(device).strip()) or "未知设备"
-        date_safe = re.sub(r'[<>:"/\\|?*\s]+', "_", str(date_str).strip()) or "无日期"
+        safe = _SAFE_WITH_SPACE_RE.sub("_", str(device).strip()) or "未知设备"
+        date_safe = _SAFE_WITH_SPACE_RE.sub("_", str(date_str).strip()) or "无日期"
         parts = [safe, date_safe]
         res_trim = str(resolution_str).strip() if resolution_str else ""
         if res_trim and res_trim != "未知":
-            parts.append(re.sub(r'[<>:"/\\|?*\s]+', "_", res_trim))
+            parts.append(_SAFE_WITH_SPACE_RE.sub("_", res_trim))
         fps_trim = str(fps_str).strip() if fps_str else ""
         if fps_trim:
-            parts.append(re.sub(r'[<>:"/\\|?*\s]+', "_", fps_trim))
+            parts.append(_SAFE_WITH_SPACE_RE.sub("_", fps_trim))
         return "_".join(parts).strip("_")[:120]
 
     def resolve_destination(
         self, target_dir: Path, filepath: Path, unified_basename: Optional[str] = None
     ) -> Optional[Path]:
         """考虑重复策略得到最终目标路径。unified_basename 若提供则用于统一命名（不含扩展名）。
-        目标已存在时：skip/rename 均分配 _2、_3 等新路径，避免文件遗落在子文件夹；仅当目标与源为同一文件时返回原路径。"""
+        目标已存在时：skip/rename 均分配 _2、_3 等新路径，避免文件遗落在子文件夹；仅当目标与源为同一文件时返回原路径。
+        返回的路径会被预留（其他线程不会再分配到），写入完成后须调用 release_destination 释放。"""
         if unified_basename is not None:
             stem, ext = unified_basename, filepath.suffix
         else:
             stem, ext = filepath.stem, filepath.suffix
-        dest = target_dir / f"{stem}{ext}"
-        if not dest.exists():
+        with self._dest_lock:
+            dest = target_dir / f"{stem}{ext}"
+            if str(dest) not in self._reserved_dests:
+                if not dest.exists():
+                    self._reserved_dests.add(str(dest))
+                    return dest
+                if dest.resolve() == filepath.resolve():
+                    return dest
+                strategy = getattr(self.config, "duplicate_strategy", "rename")
+                if strategy == "overwrite":
+                    self._reserved_dests.add(str(dest))
+                    return dest
+            # skip 与 rename：目标已存在时均分配新名称，确保文件被归类而不遗落
+            for i in range(1, 9999):
+                dest = target_dir / f"{stem}_{i}{ext}"
+                if str(dest) not in self._reserved_dests and not dest.exists():
+                    self._reserved_dests.add(str(dest))
+                    return dest
             return dest
-        if dest.resolve() == filepath.resolve():
-            return dest
-        strategy = getattr(self.config, "duplicate_strategy", "rename")
-        if strategy == "overwrite":
-            return dest
-        # skip 与 rename：目标已存在时均分配新名称，确保文件被归类而不遗落
-        for i in range(1, 9999):
-            dest = target_dir / f"{stem}_{i}{ext}"
-            if not dest.exists():
-                return dest
-        return dest
 
-    def process_file(
+    def _rsync_other_files(
         self,
-        filepath: Path,
-        output_root: Path,
-        dry_run: bool = False,
-        report_list: Optional[List[Tuple[str, str, Optional[str]]]] = None,
-    ) -> bool:
-        """处理单个主文件：识别、建目录、移动主文件及关联文件。report_list 用于收集 (动作, 源, 目标或原因)。"""
-        path_key = str(filepath.resolve())
-        output_resolved = Path(output_root).resolve()
-        unknown_dev = _sanitize_folder_name(getattr(self.config, "device_unknown_name", "未知设备"))
-        if path_key in self.processed:
+        source_root: Path,
+        other_folder: Path,
+        items: List[Tuple[Path, Path, Path]],
+        target_key: str,
+        source_key: str,
+    ) -> Set[Path]:
+        """用一次 rsync 批量拷贝其他文件（省去逐个文件的 Python 往返），返回已确认拷贝完成的源路径。
+        仅 POSIX 且已安装 rsync 时生效；已在拷贝记录中或目标正被写入的文件不参与，未完成的由调用方逐个拷贝。"""
+        rsync = shutil.which("rsync") if os.name != "nt" else None
+        done: Set[Path] = set()
+        if not rsync:
+            return done
+        claimed = []
+        for f, rel, dest in items:
+            key = self._copied_key(target_key, source_key, source_root, f)
+            if not self._is_copied(key) and self._claim_destination(dest):
+                claimed.append((f, rel, dest, key))
+        if not claimed:
+            return done
+        logger.info("超级拷贝: 用 rsync 批量拷贝 %d 个其他文件", len(claimed))
+        try:
+            other_folder.mkdir(parents=True, exist_ok=True)
+            # 以 NUL 分隔的相对路径列表，文件名含换行等字符也不受影响；rsync 先写临时文件再改名，目标不会残留半个文件
+            with tempfile.NamedTemporaryFile("wb", suffix=".lst", delete=False) as lst:
+                lst.write(b"\0".join(os.fsencode(str(rel)) for _f, rel, _d, _k in claimed))
             try:
-                rel = filepath.resolve().relative_to(output_resolved)
+                proc = subprocess.run(
+                    [
+                        rsync, "--files-from", lst.name, "--from0", "-L", "-p", "-t", "-I", "--",
+                        os.path.join(str(source_root), ""), os.path.join(str(other_folder), ""),
+                    ],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                )
+            finally:
+                os.unlink(lst.name)
+            if proc.returncode:
+                logger.warning("rsync 未全部成功（返回码 %d），其余其他文件逐个拷贝", proc.returncode)
+                logger.debug("rsync: %s", proc.stderr.decode("utf-8", "replace")[-2000:])
+            for f, rel, dest, key in claimed:
+                try:
+                    s_st, d_st = f.stat(), dest.stat()
+                except OSError:
+                    continue
+                if s_st.st_size == d_st.st_size and int(s_st.st_mtime) == int(d_st.st_mtime):
+                    logger.info("超级拷贝 已拷贝(其他): %s", rel)
+                    self._mark_copied(key, dest)
+                    done.add(f)
+        except OSError as e:
+            logger.warning("rsync 批量拷贝失败，改为逐个拷贝: %s", e)
+        finally:
+            for _f, _rel, dest, _key in claimed:
+                self.release_destination(dest)
+        return done
+
+    def _claim_destination(self, dest: Path) -> bool:
+        """预留一个固定目标路径（如「其他文件」），已被其他线程占用时返回 False。"""
+        with self._dest_lock:
+            if str(dest) in self._reserved_dests:
+                return False
+            self._reserved_dests.add(str(dest))
+            return True
+
+    def release_destination(self, dest: Optional[Path]):
+        """释放 resolve_destination / _claim_destination 预留的目标路径。"""
+        if dest is None:
+            return
+        with self._dest_lock:
+            self._reserved_dests.discard(str(dest))
+
+    def plan_file(self, filepath: Path, output_root: Path, check_processed: bool = True) -> FilePlan:
+        """识别单个主文件并计算目标目录与统一命名，不移动文件、不修改状态，可在线程池中并行执行。"""
+        resolved = filepath.resolve()
+        path_key = str(resolved)
+        plan = FilePlan(path=filepath, path_key=path_key)
+        if check_processed and path_key in self.processed:
+            output_resolved = self._resolved_root(output_root)
+            unknown_dev = _sanitize_folder_name(self.unknown_device)
+            try:
+                rel = resolved.relative_to(output_resolved)
                 # 已在「日期/类型/设备」结构下且设备不为「未知设备」则视为已整理，跳过
-                if rel.parts and len(rel.parts) >= 3 and re.match(r"^\d{4}-\d{2}-\d{2}$", rel.parts[0]):
+                if rel.parts and len(rel.parts) >= 3 and _DATE_DASH_RE.match(rel.parts[0]):
                     device_subfolder = rel.parts[2]  # 日期/类型/设备 中的设备
                     if device_subfolder != unknown_dev:
-                        logger.info("已整理过(跳过): %s", filepath.name)
-                        if report_list is not None:
-                            report_list.append(("already_processed", str(filepath), "此前已整理"))
-                        return True
+                        plan.already_processed = True
+                        return plan
             except ValueError:
                 pass
             # 在 processed 但不在正确设备下（如 未知设备、其他文件、子文件夹），重新归类
@@ -675,46 +1929,75 @@ class MediaOrganizer:
 
         media_type = self.get_media_type(filepath)
         if not media_type:
-            return False
+            return plan
 
         shoot_date = self.get_shoot_date(filepath, media_type)
-        date_str = shoot_date.strftime(
-            getattr(self.config, "folder_structure", {}).get("date_format", "%Y-%m-%d")
-        ) if shoot_date else "无日期"
+        date_str = shoot_date.strftime(self.date_format) if shoot_date else "无日期"
         device = self.get_device(filepath, media_type)
 
-        info = MediaInfo(
+        plan.info = MediaInfo(
             path=filepath,
             media_type=media_type,
             shoot_date=shoot_date,
             device=device,
             date_str=date_str,
         )
+        plan.target_dir = self.build_target_dir(plan.info, output_root)
 
-        target_dir = self.build_target_dir(info, output_root)
-        move_files = getattr(self.config, "move_files", True)
-
-        unified_basename = None
-        if getattr(self.config, "unified_naming", True):
-            w, h = _get_resolution(filepath, media_type, getattr(self.config, "use_exiftool", True))
+        if self.unified_naming:
+            w, h = _get_resolution(filepath, media_type, self.use_exiftool, self._exif_all, self._pillow_all)
             res_str = f"{w}x{h}" if (w and h) else ""
-            fps_str = _get_frame_rate(filepath, media_type, getattr(self.config, "use_exiftool", True))
-            unified_basename = self._build_unified_basename(device, date_str, res_str, fps_str)
+            fps_str = _get_frame_rate(filepath, media_type, self.use_exiftool, self._exif_all)
+            plan.unified_basename = self._build_unified_basename(device, date_str, res_str, fps_str)
+        return plan
+
+    def _resolved_root(self, root: Path) -> Path:
+        """输出根目录的 resolve() 结果，同一会话内只解析一次。"""
+        key = str(root)
+        resolved = self._root_cache.get(key)
+        if resolved is None:
+            resolved = self._root_cache[key] = Path(root).resolve()
+        return resolved
+
+    def apply_plan(
+        self,
+        plan: FilePlan,
+        dry_run: bool = False,
+        report_list: Optional[List[Tuple[str, str, Optional[str]]]] = None,
+    ) -> bool:
+        """执行 plan_file 的结果：分配目标路径、移动主文件及关联文件、记录已处理。须串行调用。"""
+        filepath, path_key = plan.path, plan.path_key
+        if plan.already_processed:
+            logger.info("已整理过(跳过): %s", filepath.name)
+            if report_list is not None:
+                report_list.append(("already_processed", str(filepath), "此前已整理"))
+            return True
+        if plan.info is None:
+            return False
+        if path_key in self.processed and not filepath.exists():
+            # 识别后、执行前已作为前面文件的关联文件被移走
+            return True
+
+        target_dir = plan.target_dir
+        unified_basename = plan.unified_basename
+        move_files = getattr(self.config, "move_files", True)
 
         primary_dest = self.resolve_destination(target_dir, filepath, unified_basename)
         if primary_dest is None:
             logger.info("跳过已存在(策略=skip): %s", filepath.name)
             if report_list is not None:
                 report_list.append(("skip", str(filepath), "已存在"))
-            self.processed.add(path_key)
+            self._mark_processed(path_key)
             return True
 
-        related = self.find_related_files(filepath, media_type)
+        related = self.find_related_files(filepath, plan.info.media_type)
 
         if not dry_run and move_files:
             try:
-                target_dir.mkdir(parents=True, exist_ok=True)
-                shutil.move(str(filepath), str(primary_dest))
+                self._ensure_dir(target_dir)
+                _move_file(filepath, primary_dest)
+                self._moved_metadata(filepath, primary_dest)
+                self._forget_listed(filepath)
                 logger.info("已移动: %s -> %s", filepath.name, primary_dest)
                 if report_list is not None:
                     report_list.append(("move", str(filepath), str(primary_dest)))
@@ -723,10 +2006,13 @@ class MediaOrganizer:
                 if report_list is not None:
                     report_list.append(("fail", str(filepath), str(e)))
                 return False
+            finally:
+                self.release_destination(primary_dest)
         else:
             logger.info("[%s] 将移动: %s -> %s", "试运行" if dry_run else "复制模式", filepath.name, primary_dest)
             if report_list is not None:
                 report_list.append(("move", str(filepath), str(primary_dest)))
+            self.release_destination(primary_dest)
         for r in related:
             r_key = str(r.resolve())
             if r_key in self.processed:
@@ -737,12 +2023,14 @@ class MediaOrganizer:
                 else self.resolve_destination(target_dir, r)
             )
             if r_dest is None:
-                self.processed.add(r_key)
+                self._mark_processed(r_key)
                 continue
             if not dry_run and move_files:
                 try:
-                    target_dir.mkdir(parents=True, exist_ok=True)
-                    shutil.move(str(r), str(r_dest))
+                    self._ensure_dir(target_dir)
+                    _move_file(r, r_dest)
+                    self._moved_metadata(r, r_dest)
+                    self._forget_listed(r)
                     logger.info("已移动关联: %s -> %s", r.name, r_dest.name)
                     if report_list is not None:
                         report_list.append(("related", str(r), str(r_dest)))
@@ -750,35 +2038,74 @@ class MediaOrganizer:
                     logger.warning("移动关联失败 %s: %s", r.name, e)
                     if report_list is not None:
                         report_list.append(("fail_related", str(r), str(e)))
+                finally:
+                    self.release_destination(r_dest)
             else:
                 logger.info("[%s] 将移动关联: %s -> %s", "试运行" if dry_run else "复制", r.name, r_dest)
                 if report_list is not None:
                     report_list.append(("related", str(r), str(r_dest)))
-            self.processed.add(r_key)
+                self.release_destination(r_dest)
+            self._mark_processed(r_key)
 
-        self.processed.add(path_key)
+        self._mark_processed(path_key)
+        self.save_processed()
         return True
 
+    def process_file(
+        self,
+        filepath: Path,
+        output_root: Path,
+        dry_run: bool = False,
+        report_list: Optional[List[Tuple[str, str, Optional[str]]]] = None,
+    ) -> bool:
+        """处理单个主文件：识别、建目录、移动主文件及关联文件。report_list 用于收集 (动作, 源, 目标或原因)。"""
+        return self.apply_plan(self.plan_file(filepath, output_root), dry_run=dry_run, report_list=report_list)
+
     def _remove_empty_dirs(self, root: Path) -> int:
-        """递归删除 root 下的空文件夹（自底向上），返回删除数量。"""
+        """递归删除 root 下的空文件夹（自底向上），返回删除数量。
+        每个目录只 scandir 一次：子目录都已删除且没有其他条目即为空，不再重复列目录或 stat。"""
+        self._made_dirs.clear()  # 删掉的目录之后须重新创建
         root = root.resolve()
-        if not root.exists() or not root.is_dir():
+        if not root.is_dir():
             return 0
         removed = 0
-        try:
-            for dirpath, dirnames, filenames in os.walk(str(root), topdown=False):
-                d = Path(dirpath)
-                if d.resolve() == root:
+        # 栈元素: [目录, 待处理的子目录（None 表示尚未列出）, 是否含有留下的条目]
+        stack: List[list] = [[str(root), None, False]]
+        while stack:
+            frame = stack[-1]
+            if frame[1] is None:
+                subdirs = []
+                try:
+                    with os.scandir(frame[0]) as it:
+                        for entry in it:
+                            try:
+                                is_dir = entry.is_dir(follow_symlinks=False)
+                            except OSError:
+                                is_dir = False
+                            if is_dir:
+                                subdirs.append(entry.path)
+                            else:
+                                frame[2] = True
+                except OSError as e:
+                    logger.warning("清理空文件夹时出错: %s", e)
+                    frame[2] = True
+                subdirs.reverse()
+                frame[1] = subdirs
+            if frame[1]:
+                stack.append([frame[1].pop(), None, False])
+                continue
+            stack.pop()
+            if not stack:
+                break  # root 本身保留
+            if not frame[2]:
+                try:
+                    os.rmdir(frame[0])
+                    removed += 1
+                    logger.debug("已删除空文件夹: %s", frame[0])
                     continue
-                if d.is_dir() and not any(d.iterdir()):
-                    try:
-                        d.rmdir()
-                        removed += 1
-                        logger.debug("已删除空文件夹: %s", d)
-                    except OSError:
-                        pass
-        except (OSError, PermissionError) as e:
-            logger.warning("清理空文件夹时出错: %s", e)
+                except OSError:
+                    pass
+            stack[-1][2] = True
         return removed
 
     def _normalize_source_path(self, path: Path) -> Path:
@@ -788,38 +2115,72 @@ class MediaOrganizer:
             s = s + os.sep
         return Path(s).resolve()
 
-    def _collect_media_files_recursive(self, root: Path) -> List[Path]:
-        """递归遍历根目录及所有子目录，收集媒体文件。使用 os.walk(str(root)) 保证 Windows 兼容。"""
+    def _io_workers(self) -> int:
+        """识别文件、批量 stat 等以等待 I/O 为主的线程池大小：配置 max_concurrency，0 为 min(32, CPU 核数×2)。"""
+        return int(getattr(self.config, "max_concurrency", 0) or 0) or min(32, (os.cpu_count() or 1) * 2)
+
+    def _nested_output_dirs(self, root: Path, output: Path) -> Set[str]:
+        """输出目录位于源目录之内（且不是源目录本身）时返回 {输出目录}，遍历源目录时整棵跳过，不把已整理/已拷贝的结果当作新来源。"""
+        root_resolved = self._normalize_source_path(root)
+        out_resolved = output.resolve()
+        if out_resolved != root_resolved and root_resolved in out_resolved.parents:
+            return {str(out_resolved)}
+        return set()
+
+    def _collect_media_files_recursive(self, root: Path, skip_dirs: Set[str] = frozenset()) -> List[str]:
+        """递归遍历根目录及所有子目录，收集媒体文件路径（字符串）。使用 os.scandir(str(root)) 保证 Windows 兼容，文件类型取自目录项。
+        skip_dirs 中的子目录（完整路径）不进入。"""
         root = self._normalize_source_path(root)
         if not root.is_dir():
             logger.warning("扫描路径不是目录或不存在: %s", root)
             return []
-        collected: List[Path] = []
-        try:
-            root_str = str(root)
-            for dirpath, _dirnames, filenames in os.walk(root_str, topdown=True, followlinks=False):
-                for name in filenames:
-                    p = Path(dirpath) / name
-                    if not p.is_file():
-                        continue
-                    if self.should_leave_in_place(p):
-                        continue
-                    if self.get_media_type(p) is not None:
-                        collected.append(p)
-        except (OSError, PermissionError) as e:
-            logger.warning("遍历子目录时出错 %s: %s", root, e)
+        collected: List[str] = []
+        # 逐目录得到文件：同一遍顺带为含媒体文件的目录建好关联文件索引，之后不必再逐目录 scandir。
+        # 收集顺序不影响结果（主文件由 _primary_files 排序选出）
+        for top, entries in _walk_dirs_parallel(str(root), skip_dirs):
+            siblings: List[str] = []
+            has_media = False
+            for entry in entries:
+                name = entry.name
+                if self._leave_name_in_place(name):
+                    continue
+                siblings.append(entry.path)
+                if self._is_media_name(name):
+                    collected.append(entry.path)
+                    has_media = True
+            if has_media:
+                self._seed_dir_listing(top, siblings)
         return collected
 
+    @staticmethod
+    def _primary_files(collected: List[str]) -> List[Path]:
+        """每个 (目录, 词干) 取文件名最小的一个作为主文件（其余同词干文件作为关联文件随之处理），按 (目录, 文件名) 排序返回。
+        一遍分组只用字符串，只对主文件排序（顺序与按 Path 比较一致）并构造 Path。"""
+        chosen: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        for s in collected:
+            head, name = os.path.split(s)
+            stem_dir = (head, name[:len(name) - len(_name_suffix(name))])
+            cur = chosen.get(stem_dir)
+            if cur is None or name < cur[0]:
+                chosen[stem_dir] = (name, s)
+        keyed = [
+            (os.path.normcase(head).split(os.sep), name, s) for (head, _stem), (name, s) in chosen.items()
+        ]
+        keyed.sort(key=lambda k: (k[0], k[1]))
+        return [Path(s) for _parts, _name, s in keyed]
+
     def scan_and_organize(
         self,
         source: Optional[Path] = None,
         output: Optional[Path] = None,
         dry_run: bool = False,
         scan_only: bool = False,
+        progress_cb=None,
     ) -> Dict:
         """
         扫描源目录并整理到输出目录（含所有子目录）。
         scan_only=True 时仅扫描并返回将执行的操作报告，不移动文件。
+        progress_cb(phase, message, current, total) 在每个主文件识别/整理后调用（经 _ThrottledProgress 节流）。
         返回 {"mode": "scan_only"|"organize", "source": str, "output": str, "total_media": int,
               "to_process": int, "entries": [(action, src, dest_or_reason), ...]}
         """
@@ -838,56 +2199,69 @@ class MediaOrganizer:
             return empty_report
         if src.resolve() == out.resolve():
             out = src  # 原地整理到子目录
+        if progress_cb:
+            progress_cb = _ThrottledProgress(progress_cb)
 
-        collected: List[Path] = self._collect_media_files_recursive(src)
+        self._begin_session()
+        cleanup_root = None
+        try:
+            result = self._scan_run(src, out, dry_run, scan_only, progress_cb)
+            if result["mode"] == "organize" and not dry_run and getattr(self.config, "delete_empty_folders", False):
+                cleanup_root = out
+        finally:
+            removed = self._end_session(cleanup_root)
+        if removed > 0:
+            logger.info("扫描整理: 已清理 %d 个空文件夹", removed)
+        if result["mode"] == "organize":
+            logger.info("扫描整理完成，共处理 %s 个主文件", result["to_process"])
+            flush_log()
+        return result
+
+    def _scan_run(self, src: Path, out: Path, dry_run: bool, scan_only: bool, progress_cb=None) -> Dict:
+        """scan_and_organize 在会话内的主体：收集、识别并（非 scan_only 时）移动，返回报告。"""
+        collected = self._collect_media_files_recursive(src, self._nested_output_dirs(src, out))
         logger.info("扫描整理: 源目录及子目录共发现 %d 个媒体文件", len(collected))
-
-        seen_stem_dir: Set[Tuple[Path, str]] = set()
-        to_process: List[Path] = []
-        for p in sorted(collected, key=lambda x: (x.parent, x.name)):
-            stem_dir = (p.parent, p.stem)
-            if stem_dir in seen_stem_dir:
-                continue
-            seen_stem_dir.add(stem_dir)
-            to_process.append(p)
+        to_process = self._primary_files(collected)
 
         report_entries: List[Tuple[str, str, Optional[str]]] = []
+        total = len(to_process)
+
+        def _progress(done: int):
+            if progress_cb:
+                try:
+                    progress_cb("progress", "", done, total)
+                except Exception:
+                    pass
+
+        # 识别（EXIF/exiftool/hachoir）按文件独立，线程池并行；map 保持原顺序，分配目标与移动仍串行执行
+        plan_workers = self._io_workers()
 
         if scan_only:
-            for fp in to_process:
-                mt = self.get_media_type(fp)
-                if not mt:
-                    continue
-                shoot_date = self.get_shoot_date(fp, mt)
-                date_str = (
-                    shoot_date.strftime(
-                        getattr(self.config, "folder_structure", {}).get("date_format", "%Y-%m-%d")
-                    )
-                    if shoot_date
-                    else "无日期"
-                )
-                device = self.get_device(fp, mt)
-                info = MediaInfo(path=fp, media_type=mt, shoot_date=shoot_date, device=device, date_str=date_str)
-                target_dir = self.build_target_dir(info, out)
-                unified_basename = None
-                if getattr(self.config, "unified_naming", True):
-                    w, h = _get_resolution(fp, mt, getattr(self.config, "use_exiftool", True))
-                    res_str = f"{w}x{h}" if (w and h) else ""
-                    fps_str = _get_frame_rate(fp, mt, getattr(self.config, "use_exiftool", True))
-                    unified_basename = self._build_unified_basename(device, date_str, res_str, fps_str)
-                primary_dest = self.resolve_destination(target_dir, fp, unified_basename)
-                if primary_dest is None:
-                    report_entries.append(("skip", str(fp), "已存在"))
-                    continue
-                report_entries.append(("move", str(fp), str(primary_dest)))
-                for r in self.find_related_files(fp, mt):
-                    r_dest = (
-                        self.resolve_destination(target_dir, r, unified_basename)
-                        if unified_basename is not None
-                        else self.resolve_destination(target_dir, r)
-                    )
-                    if r_dest is not None:
-                        report_entries.append(("related", str(r), str(r_dest)))
+            with ThreadPoolExecutor(max_workers=plan_workers) as pool:
+                plans = pool.map(lambda fp: self.plan_file(fp, out, check_processed=False), to_process)
+                for done, plan in enumerate(plans, 1):
+                    _progress(done)
+                    if plan.info is None:
+                        continue
+                    fp, mt = plan.path, plan.info.media_type
+                    target_dir, unified_basename = plan.target_dir, plan.unified_basename
+                    primary_dest = self.resolve_destination(target_dir, fp, unified_basename)
+                    if primary_dest is None:
+                        report_entries.append(("skip", str(fp), "已存在"))
+                        continue
+                    report_entries.append(("move", str(fp), str(primary_dest)))
+                    self.release_destination(primary_dest)
+                    for r in self.find_related_files(fp, mt):
+                        r_dest = (
+                            self.resolve_destination(target_dir, r, unified_basename)
+                            if unified_basename is not None
+                            else self.resolve_destination(target_dir, r)
+                        )
+                        if r_dest is not None:
+                            report_entries.append(("related", str(r), str(r_dest)))
+                            self.release_destination(r_dest)
+            self.save_metadata_store()
+            flush_log()
             return {
                 "mode": "scan_only",
                 "source": str(src),
@@ -897,17 +2271,12 @@ class MediaOrganizer:
                 "entries": report_entries,
             }
 
-        for fp in to_process:
-            self.process_file(fp, out, dry_run=dry_run, report_list=report_entries)
+        with ThreadPoolExecutor(max_workers=plan_workers) as pool:
+            for done, plan in enumerate(pool.map(lambda fp: self.plan_file(fp, out), to_process), 1):
+                self.apply_plan(plan, dry_run=dry_run, report_list=report_entries)
+                _progress(done)
         self.save_processed(force=True)
-        if (
-            not dry_run
-            and getattr(self.config, "delete_empty_folders", False)
-        ):
-            n = self._remove_empty_dirs(out)
-            if n > 0:
-                logger.info("扫描整理: 已清理 %d 个空文件夹", n)
-        logger.info("扫描整理完成，共处理 %s 个主文件", len(to_process))
+        self.save_metadata_store()
         return {
             "mode": "organize",
             "source": str(src),
@@ -922,7 +2291,8 @@ class MediaOrganizer:
     ) -> Tuple[bool, Optional[str]]:
         """
         拷贝文件并做哈希校验。progress_cb(phase, message, current, total) 用于界面进度与日志。
-        phase: "hash_src"|"copy"|"hash_dest"|"verify_ok"|"verify_fail"|"progress"
+        phase: "copy"|"hash_dest"|"verify_ok"|"verify_fail"|"progress"
+        源文件只读一遍：拷贝时同时计算源哈希并读回目标文件比对；super_copy_verify_dest 关闭时两者都省去。
         """
         def _cb(phase: str, msg: str, cur: Optional[int] = None, total: Optional[int] = None):
             if progress_cb:
@@ -934,20 +2304,28 @@ class MediaOrganizer:
         if dry_run:
             logger.info("[超级拷贝 试运行] 将拷贝: %s -> %s", src.name, dest)
             return True, None
-        _cb("hash_src", f"计算源文件哈希: {src.name}")
-        src_hash = _compute_file_hash(src)
-        if src_hash is None:
-            _cb("verify_fail", f"失败: 无法计算源文件哈希 - {src.name}")
-            return False, "无法计算源文件哈希"
         _cb("copy", f"拷贝中: {src.name}")
         try:
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(str(src), str(dest))
+            self._ensure_dir(dest.parent)
+            # 不读回校验时源哈希无从比对，不再计算，拷贝可走内核 copy_file_range
+            src_hash = _copy_file_data(
+                src, dest, preallocate=getattr(self.config, "preallocate_copies", True),
+                hash_algo=self.hash_algo if self.verify_dest else None,
+            )
         except Exception as e:
             _cb("verify_fail", f"失败: 拷贝异常 - {src.name}")
             return False, str(e)
+        if not self.verify_dest:
+            logger.info("超级拷贝 已拷贝（未读回校验）: %s -> %s", src.name, dest)
+            _cb("verify_ok", f"拷贝完成: {src.name}")
+            return True, None
+        if src_hash is None:
+            # reflink 克隆：目标与源共享同一份数据块，读回比对只会读到相同的块
+            logger.info("超级拷贝 已克隆（写时复制）: %s -> %s", src.name, dest)
+            _cb("verify_ok", f"克隆完成: {src.name}")
+            return True, None
         _cb("hash_dest", f"校验目标哈希: {dest.name}")
-        dest_hash = _compute_file_hash(dest)
+        dest_hash = _compute_file_hash(dest, self.hash_algo, self.hash_mmap)
         if dest_hash is None:
             try:
                 dest.unlink(missing_ok=True)
@@ -966,18 +2344,121 @@ class MediaOrganizer:
         _cb("verify_ok", f"校验通过: {src.name}")
         return True, None
 
+    def _super_copy_media_chunk(
+        self,
+        chunk: List[Path],
+        source_root: Path,
+        source_key: str,
+        target: Path,
+        target_key: str,
+        dry_run: bool,
+        next_op,
+        emit,
+    ) -> Dict:
+        """超级拷贝的工作线程：依次处理一组主文件及其关联文件，返回本组的统计与报告。"""
+        part = {"ok": 0, "fail": 0, "skip": 0, "media_ok": [], "media_skip": [], "media_fail": [], "copied": set()}
+        for fp in chunk:
+            p_key = self._copied_key(target_key, source_key, source_root, fp)
+            primary_done = self._is_copied(p_key)
+            if primary_done:
+                related = self.find_related_files(fp)
+                related_keys = [self._copied_key(target_key, source_key, source_root, r) for r in related]
+                if all(self._is_copied(k) for k in related_keys):
+                    part["skip"] += 1
+                    part["media_skip"].append((str(fp), "此前已拷贝"))
+                    part["copied"].add(fp)
+                    part["copied"].update(related)
+                    continue
+            # 识别与目标目录/统一命名与整理共用 plan_file，保证两种模式归类结果一致
+            plan = self.plan_file(fp, target, check_processed=False)
+            if plan.info is None:
+                part["skip"] += 1
+                continue
+            target_dir = plan.target_dir
+            unified_basename = plan.unified_basename
+            if primary_done:
+                # 主文件此前已拷贝，只补拷新增/变化的关联文件
+                part["skip"] += 1
+                part["media_skip"].append((str(fp), "此前已拷贝"))
+                part["copied"].add(fp)
+            else:
+                primary_dest = self.resolve_destination(target_dir, fp, unified_basename)
+                if primary_dest is None:
+                    part["skip"] += 1
+                    part["media_skip"].append((str(fp), "已存在"))
+                    logger.info("超级拷贝 跳过已存在: %s", fp.name)
+                    continue
+                op = next_op()
+                try:
+                    ok, err = self._copy_file_with_hash_verify(
+                        fp, primary_dest, dry_run, lambda ph, msg, _c, _t, op=op: emit(ph, msg, op)
+                    )
+                finally:
+                    self.release_destination(primary_dest)
+                emit("progress", "", op)
+                if not ok:
+                    part["fail"] += 1
+                    part["media_fail"].append((str(fp), err or ""))
+                    logger.error("超级拷贝 失败 %s: %s", fp.name, err or "")
+                    continue
+                part["ok"] += 1
+                part["media_ok"].append((str(fp), str(primary_dest)))
+                part["copied"].add(fp)
+                if not dry_run:
+                    self._mark_copied(p_key, primary_dest)
+
+            related = self.find_related_files(fp, plan.info.media_type)
+            for r in related:
+                r_key = self._copied_key(target_key, source_key, source_root, r)
+                if self._is_copied(r_key):
+                    part["copied"].add(r)
+                    continue
+                r_dest = (
+                    self.resolve_destination(target_dir, r, unified_basename)
+                    if unified_basename is not None
+                    else self.resolve_destination(target_dir, r)
+                )
+                if r_dest is None:
+                    continue
+                op = next_op()
+                try:
+                    ok, err = self._copy_file_with_hash_verify(
+                        r, r_dest, dry_run, lambda ph, msg, _c, _t, op=op: emit(ph, msg, op)
+                    )
+                finally:
+                    self.release_destination(r_dest)
+                emit("progress", "", op)
+                if not ok:
+                    part["media_fail"].append((str(r), err or ""))
+                    logger.warning("超级拷贝 关联文件失败 %s: %s", r.name, err or "")
+                else:
+                    part["ok"] += 1
+                    part["media_ok"].append((str(r), str(r_dest)))
+                    part["copied"].add(r)
+                    if not dry_run:
+                        self._mark_copied(r_key, r_dest)
+        return part
+
     def super_copy_and_organize(
         self,
         source: Path,
         target: Path,
         dry_run: bool = False,
         progress_cb=None,
-    ) -> Dict[str, int]:
+        copy_threads: Optional[int] = None,
+        source_id: Optional[str] = None,
+    ) -> Dict:
         """
         超级拷贝：将源文件夹拷贝到目标目录，按日期/类型/设备自动整理，并做哈希校验。
-        返回 {"ok": 成功数, "fail": 失败数, "skip": 跳过数, "report": {...}}。
+        copy_threads 为并行拷贝线程数（每个线程拷贝并校验各自的文件），为空或 0 时取配置 super_copy_threads，
+        其仍为 0 时取 min(8, CPU 核数)。
+        progress_cb 会被多个拷贝线程并发调用，须线程安全；其中不带消息的计数事件经节流（见 _ThrottledProgress）。
+        source_id 为源卷 UUID（守护进程提供）：已拷贝记录按它而非挂载路径区分设备，同一张卡换了挂载点再插入仍可跳过。
+        返回 {"ok": 成功数, "fail": 失败数, "skip": 跳过数, "hash_algo": 校验算法, "report": {...}}。
         """
-        stats = {"ok": 0, "fail": 0, "skip": 0, "report": None}
+        stats = {"ok": 0, "fail": 0, "skip": 0, "hash_algo": self.hash_algo, "report": None}
+        if progress_cb:
+            progress_cb = _ThrottledProgress(progress_cb)
         report = {
             "media_ok": [],      # [(src, dest), ...]
             "media_skip": [],    # [(src, reason), ...]
@@ -991,21 +2472,52 @@ class MediaOrganizer:
         target.mkdir(parents=True, exist_ok=True)
 
         source_resolved = self._normalize_source_path(source)
-        logger.info("超级拷贝: 扫描源目录（含子目录） %s", source_resolved)
+        target_key = str(target.resolve())
+        source_key = f"uuid:{source_id}" if source_id else str(source_resolved)
+        self._begin_session()
+        cleanup_root = None
         try:
-            collected: List[Path] = self._collect_media_files_recursive(source)
+            if not self._super_copy_run(
+                source, target, source_resolved, source_key, target_key, dry_run, progress_cb, copy_threads, stats,
+                report,
+            ):
+                return stats
+            if not dry_run and getattr(self.config, "delete_empty_folders", False):
+                cleanup_root = target
+        finally:
+            removed = self._end_session(cleanup_root)
+        if removed > 0:
+            logger.info("超级拷贝: 已清理 %d 个空文件夹", removed)
+        self.save_copied_index(force=True)
+        self.save_metadata_store()
+        logger.info("超级拷贝完成: 成功=%d 失败=%d 跳过=%d", stats["ok"], stats["fail"], stats["skip"])
+        flush_log()
+        stats["report"] = report
+        return stats
+
+    def _super_copy_run(
+        self,
+        source: Path,
+        target: Path,
+        source_resolved: Path,
+        source_key: str,
+        target_key: str,
+        dry_run: bool,
+        progress_cb,
+        copy_threads: Optional[int],
+        stats: Dict,
+        report: Dict,
+    ) -> bool:
+        """super_copy_and_organize 在会话内的主体：拷贝媒体与其他文件并累计到 stats/report。
+        源目录扫描失败或没有可处理的媒体文件时返回 False。"""
+        logger.info("超级拷贝: 扫描源目录（含子目录） %s，校验算法 %s", source_resolved, self.hash_algo.upper())
+        try:
+            skip_dirs = self._nested_output_dirs(source, target)
+            collected = self._collect_media_files_recursive(source, skip_dirs)
         except (OSError, PermissionError) as e:
             logger.error("超级拷贝: 扫描源目录失败 %s: %s", source, e)
-            return stats
-
-        seen_stem_dir: Set[Tuple[Path, str]] = set()
-        to_process: List[Path] = []
-        for p in sorted(collected, key=lambda x: (x.parent, x.name)):
-            stem_dir = (p.parent, p.stem)
-            if stem_dir in seen_stem_dir:
-                continue
-            seen_stem_dir.add(stem_dir)
-            to_process.append(p)
+            return False
+        to_process = self._primary_files(collected)
 
         logger.info("超级拷贝: 源目录及子目录共发现 %d 个媒体文件，待处理 %d 个", len(collected), len(to_process))
         if not to_process:
@@ -1013,13 +2525,12 @@ class MediaOrganizer:
                 "超级拷贝: 未发现可处理的媒体文件。请确认：1) 源路径下是否有图片/视频/音频；"
                 "2) 扩展名是否在 config.json 的 image_extensions / video_extensions / audio_extensions 中。"
             )
-            return stats
+            return False
 
         total_ops = 0
         for fp in to_process:
-            mt = self.get_media_type(fp)
-            if mt:
-                total_ops += 1 + len(self.find_related_files(fp, mt))
+            if self.is_media_file(fp):
+                total_ops += 1 + len(self.find_related_files(fp))
         if progress_cb:
             try:
                 progress_cb("progress", "", 0, max(1, total_ops))
@@ -1028,115 +2539,75 @@ class MediaOrganizer:
 
         copied_paths: Set[Path] = set()
         current_op: int = 0
-        for fp in to_process:
-            media_type = self.get_media_type(fp)
-            if not media_type:
-                stats["skip"] += 1
-                continue
-            shoot_date = self.get_shoot_date(fp, media_type)
-            date_str = (
-                shoot_date.strftime(
-                    getattr(self.config, "folder_structure", {}).get("date_format", "%Y-%m-%d")
-                )
-                if shoot_date
-                else "无日期"
-            )
-            device = self.get_device(fp, media_type)
-            info = MediaInfo(
-                path=fp,
-                media_type=media_type,
-                shoot_date=shoot_date,
-                device=device,
-                date_str=date_str,
-            )
-            target_dir = self.build_target_dir(info, target)
-            unified_basename = None
-            if getattr(self.config, "unified_naming", True):
-                w, h = _get_resolution(fp, media_type, getattr(self.config, "use_exiftool", True))
-                res_str = f"{w}x{h}" if (w and h) else ""
-                fps_str = _get_frame_rate(fp, media_type, getattr(self.config, "use_exiftool", True))
-                unified_basename = self._build_unified_basename(device, date_str, res_str, fps_str)
-            primary_dest = self.resolve_destination(target_dir, fp, unified_basename)
-            if primary_dest is None:
-                stats["skip"] += 1
-                report["media_skip"].append((str(fp), "已存在"))
-                logger.info("超级拷贝 跳过已存在: %s", fp.name)
-                continue
-            current_op += 1
-            def _primary_cb(ph, msg, _c, _t):
-                if progress_cb:
-                    try:
-                        progress_cb(ph, msg, current_op, total_ops)
-                    except Exception:
-                        pass
-            ok, err = self._copy_file_with_hash_verify(fp, primary_dest, dry_run, _primary_cb)
+        op_lock = threading.Lock()
+
+        def _next_op() -> int:
+            nonlocal current_op
+            with op_lock:
+                current_op += 1
+                return current_op
+
+        def _emit(phase: str, msg: str, op: int):
             if progress_cb:
                 try:
-                    progress_cb("progress", "", current_op, total_ops)
+                    progress_cb(phase, msg, op, total_ops)
                 except Exception:
                     pass
-            if not ok:
-                stats["fail"] += 1
-                report["media_fail"].append((str(fp), err or ""))
-                logger.error("超级拷贝 失败 %s: %s", fp.name, err or "")
-                continue
-            stats["ok"] += 1
-            report["media_ok"].append((str(fp), str(primary_dest)))
-            copied_paths.add(fp.resolve())
 
-            related = self.find_related_files(fp, media_type)
-            for r in related:
-                current_op += 1
-                r_dest = (
-                    self.resolve_destination(target_dir, r, unified_basename)
-                    if unified_basename is not None
-                    else self.resolve_destination(target_dir, r)
+        # 默认按文件大小降序后轮询分配到各线程：最大的文件先开始，各线程耗时更均衡。
+        # 源在机械硬盘上时改按 inode 升序，读取顺序接近磁盘上的布局，减少磁头来回寻道
+        def _stat_key(p: Path) -> Tuple[int, int]:
+            try:
+                st = p.stat()
+                return st.st_size, st.st_ino
+            except OSError:
+                return 0, 0
+
+        if not copy_threads:
+            copy_threads = int(getattr(self.config, "super_copy_threads", 0) or 0) or min(8, os.cpu_count() or 1)
+        n_workers = max(1, min(int(copy_threads), len(to_process)))
+        # 网络盘/读卡器上逐个 stat 的往返延迟可观，并行取大小
+        with ThreadPoolExecutor(max_workers=min(self._io_workers(), len(to_process))) as ex:
+            keys = dict(zip(to_process, ex.map(_stat_key, to_process)))
+        hdd = getattr(self.config, "optimize_for_hdd", "auto")
+        if hdd == "auto":
+            hdd = _is_rotational(source_resolved)
+        if hdd:
+            logger.info("超级拷贝: 源位于机械硬盘，按磁盘布局（inode）顺序读取")
+            ordered = sorted(to_process, key=lambda p: keys[p][1])
+        else:
+            ordered = sorted(to_process, key=lambda p: keys[p][0], reverse=True)
+        chunks = [ordered[i::n_workers] for i in range(n_workers)]
+        with ThreadPoolExecutor(max_workers=n_workers) as ex:
+            futs = [
+                ex.submit(
+                    self._super_copy_media_chunk,
+                    chunk, source_resolved, source_key, target, target_key, dry_run, _next_op, _emit,
                 )
-                if r_dest is None:
-                    current_op -= 1
-                    continue
-                def _rel_cb(ph, msg, _c, _t):
-                    if progress_cb:
-                        try:
-                            progress_cb(ph, msg, current_op, total_ops)
-                        except Exception:
-                            pass
-                ok, err = self._copy_file_with_hash_verify(r, r_dest, dry_run, _rel_cb)
-                if progress_cb:
-                    try:
-                        progress_cb("progress", "", current_op, total_ops)
-                    except Exception:
-                        pass
-                if not ok:
-                    report["media_fail"].append((str(r), err or ""))
-                    logger.warning("超级拷贝 关联文件失败 %s: %s", r.name, err or "")
-                else:
-                    stats["ok"] += 1
-                    report["media_ok"].append((str(r), str(r_dest)))
-                    copied_paths.add(r.resolve())
+                for chunk in chunks
+            ]
+            results = [f.result() for f in futs]
+        for part in results:
+            for k in ("ok", "fail", "skip"):
+                stats[k] += part[k]
+            for k in ("media_ok", "media_skip", "media_fail"):
+                report[k].extend(part[k])
+            copied_paths |= part["copied"]
 
         other_folder = target / "其他文件"
         other_files_list: List[Tuple[Path, Path, Path]] = []
-        try:
-            for dirpath, _dirnames, filenames in os.walk(str(source_resolved), topdown=True, followlinks=False):
-                for name in filenames:
-                    f = Path(dirpath) / name
-                    try:
-                        fres = f.resolve()
-                    except OSError:
-                        continue
-                    if fres in copied_paths:
-                        continue
-                    if self.should_leave_in_place(f):
-                        continue
-                    try:
-                        rel = f.relative_to(source_resolved)
-                    except ValueError:
-                        continue
-                    dest_file = other_folder / rel
-                    other_files_list.append((f, rel, dest_file))
-        except (OSError, PermissionError) as e:
-            logger.warning("超级拷贝 遍历其他文件时出错: %s", e)
+        # 按字符串比较与截取相对路径，只为真正要拷贝的文件构造 Path
+        copied_strs = {str(p) for p in copied_paths}
+        root_prefix = os.path.join(str(source_resolved), "")
+        # 与收集媒体文件相同的 scandir 遍历，文件类型取自目录项
+        for entry in _walk_files(str(source_resolved), skip_dirs):
+            full = entry.path
+            if full in copied_strs or self._leave_name_in_place(entry.name):
+                continue
+            if not full.startswith(root_prefix):
+                continue
+            rel = Path(full[len(root_prefix):])
+            other_files_list.append((Path(full), rel, other_folder / rel))
 
         total_ops += len(other_files_list)
         if progress_cb and other_files_list:
@@ -1145,37 +2616,52 @@ class MediaOrganizer:
             except Exception:
                 pass
 
-        for f, rel, dest_file in other_files_list:
-            current_op += 1
-            if progress_cb:
-                try:
-                    progress_cb("progress", f"其他文件: {rel}", current_op, total_ops)
-                except Exception:
-                    pass
+        bulk_done: Set[Path] = set()
+        if not dry_run and len(other_files_list) >= RSYNC_MIN_FILES:
+            bulk_done = self._rsync_other_files(
+                source_resolved, other_folder, other_files_list, target_key, source_key
+            )
+
+        def _copy_other(item: Tuple[Path, Path, Path]) -> Tuple[str, Optional[str]]:
+            """拷贝单个其他文件，返回 (ok|skip|fail|none, 失败原因)；统计在主线程按原顺序汇总。"""
+            f, rel, dest_file = item
+            _emit("progress", f"其他文件: {rel}", _next_op())
             if dry_run:
                 logger.info("[超级拷贝 试运行] 将拷贝(其他): %s -> %s", f.name, dest_file)
-                stats["ok"] += 1
-                report["other_ok"].append(str(rel))
-                continue
+                return "ok", None
+            if f in bulk_done:
+                return "ok", None
+            o_key = self._copied_key(target_key, source_key, source_resolved, f)
+            if self._is_copied(o_key):
+                return "skip", None
+            if not self._claim_destination(dest_file):
+                logger.warning("超级拷贝 其他文件跳过(目标正被写入) %s", rel)
+                return "none", "目标正被其他拷贝任务写入"
             try:
-                dest_file.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(str(f), str(dest_file))
-                stats["ok"] += 1
-                report["other_ok"].append(str(rel))
+                self._ensure_dir(dest_file.parent)
+                _copy_file_data(f, dest_file, preallocate=getattr(self.config, "preallocate_copies", True))
                 logger.info("超级拷贝 已拷贝(其他): %s", rel)
+                self._mark_copied(o_key, dest_file)
+                return "ok", None
             except Exception as e:
-                report["other_fail"].append((str(rel), str(e)))
                 logger.warning("超级拷贝 其他文件失败 %s: %s", rel, e)
+                return "fail", str(e)
+            finally:
+                self.release_destination(dest_file)
+
+        # 其他文件多为小文件，串行时主要耗在逐个打开/创建文件的等待上，与媒体文件共用同样的线程数
+        if other_files_list:
+            with ThreadPoolExecutor(max_workers=max(1, min(int(copy_threads), len(other_files_list)))) as ex:
+                for (_f, rel, _dest), (status, err) in zip(other_files_list, ex.map(_copy_other, other_files_list)):
+                    if status == "ok":
+                        stats["ok"] += 1
+                        report["other_ok"].append(str(rel))
+                    elif status == "skip":
+                        stats["skip"] += 1
+                    else:
+                        report["other_fail"].append((str(rel), err))
+
+        return True
 
-        if (
-            not dry_run
-            and getattr(self.config, "delete_empty_folders", False)
-        ):
-            n = self._remove_empty_dirs(target)
-            if n > 0:
-                logger.info("超级拷贝: 已清理 %d 个空文件夹", n)
-        logger.info("超级拷贝完成: 成功=%d 失败=%d 跳过=%d", stats["ok"], stats["fail"], stats["skip"])
-        stats["report"] = report
-        return stats
 
 
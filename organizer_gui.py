@@ -5,9 +5,14 @@
 参考 KOCARD 卡片式设计，采用 ttkbootstrap 暗色主题
 """
 
+import logging
+import logging.handlers
+import multiprocessing
 import os
+import queue
 import sys
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from tkinter import scrolledtext, messagebox, filedialog
@@ -34,10 +39,69 @@ except Exception as e:
         pass
     sys.exit(1)
 
+# 扫描报告每类条目的行格式（名称, 目标/原因）
+_SCAN_REPORT_LINES = {
+    "move": lambda name, dest: f"  [将移动] {name} -> {dest}",
+    "related": lambda name, dest: f"  [关联]   {name} -> {dest}",
+    "skip": lambda name, dest: f"  [跳过]   {name} ({dest})",
+    "already_processed": lambda name, dest: f"  [已整理过] {name} ({dest or '此前已整理'})",
+    "fail": lambda name, dest: f"  [失败]   {name} - {dest}",
+}
+
+
+_organizer = None
+# 超级拷贝会话独占复用的 MediaOrganizer：_begin_session 会清空其会话缓存，不能与另一会话重叠
+_organizer_lock = threading.Lock()
+
+
+def _get_organizer(config):
+    """复用同一 config 的 MediaOrganizer，免去每次点击重新加载记录、缓存与设备库。
+    只供界面进程内串行的超级拷贝使用，调用方须持有 _organizer_lock 直到会话结束。"""
+    global _organizer
+    if _organizer is None or _organizer.config is not config:
+        _organizer = MediaOrganizer(config)
+    return _organizer
+
+
+class _ScanLogHandler(logging.handlers.QueueHandler):
+    """子进程中把核心模块的日志以 ("log", 文本) 送入结果队列，由界面进程写入运行日志。"""
+
+    def enqueue(self, record):
+        self.queue.put(("log", record.getMessage()))
+
+
+def _scan_worker(config, source, output, scan_only, results):
+    """在独立进程中执行扫描/整理，经 results 队列向界面进程发送 ("log", 文本)、("progress", 当前, 总数)，
+    最后发送 ("done", 报告) 或 ("error", 原因)。
+    子进程自建 MediaOrganizer，不与界面进程共享锁、exiftool 进程池等状态。"""
+    handler = _ScanLogHandler(results)
+    handler.setLevel(logging.INFO)
+    logging.getLogger("media_organizer").addHandler(handler)
+
+    def progress_cb(phase, message, current, total):
+        results.put(("progress", current, total))
+
+    try:
+        report = MediaOrganizer(config).scan_and_organize(
+            source=source, output=output, dry_run=False, scan_only=scan_only, progress_cb=progress_cb
+        )
+        results.put(("done", report))
+    except Exception as e:
+        results.put(("error", str(e)))
+
+
 # 暗色主题文本区域配色
 TEXT_BG = "#2b3e50"
 TEXT_FG = "#ecf0f1"
 TEXT_INSERT = "#3498db"
+# 日志区每隔多少毫秒把积累的消息一次性写入（工作线程只入队，不逐行调度界面更新）
+LOG_DRAIN_MS = 50
+# 每个周期最多写入的行数：上万行的任务报告分摊到多个周期，单次插入不致卡住界面
+LOG_DRAIN_MAX_LINES = 2000
+# 日志视图底边位于该比例以下视为用户在翻看历史，追加时不自动滚动
+LOG_FOLLOW_THRESHOLD = 0.995
+# 超级拷贝进度条重绘间隔（约 30 帧/秒），只在有新进度时重绘
+PROGRESS_TICK_MS = 33
 
 
 def _bs(style):
@@ -119,46 +183,47 @@ def main():
     delete_empty_var = ttk.BooleanVar(value=getattr(config, "delete_empty_folders", False))
     ttk.Checkbutton(scan_card, text="整理完成后清理目标目录中的空文件夹", variable=delete_empty_var).pack(anchor=W, pady=(0, 8))
 
-    def format_scan_report(report):
-        """将扫描/整理报告格式化为可输出到日志的完整报告文本。"""
+    # 扫描整理进度条与状态（由子进程经队列回传）
+    scan_progress_frm = ttk.Frame(scan_card)
+    scan_progress_frm.pack(fill=X, pady=(0, 6))
+    scan_progress_label = ttk.Label(scan_progress_frm, text="")
+    scan_progress_label.pack(anchor=W)
+    scan_progress = ttk.Progressbar(scan_progress_frm, mode="determinate", maximum=100, value=0)
+    scan_progress.pack(fill=X, pady=(2, 0))
+
+    def iter_scan_report_lines(report):
+        """逐行生成扫描/整理任务报告，直接送入日志队列，不拼接整段文本。"""
         if not report or not isinstance(report, dict):
-            return ""
-        lines = [
-            "========== 扫描/整理任务报告 ==========",
-            f"模式: {'仅扫描（试运行）' if report.get('mode') == 'scan_only' else '扫描并整理'}",
-            f"源目录: {report.get('source', '')}",
-            f"输出目录: {report.get('output', '')}",
-            f"发现媒体文件数: {report.get('total_media', 0)}",
-            f"待处理主文件数: {report.get('to_process', 0)}",
-            "----------------------------------------",
-        ]
+            return
+        yield "========== 扫描/整理任务报告 =========="
+        yield f"模式: {'仅扫描（试运行）' if report.get('mode') == 'scan_only' else '扫描并整理'}"
+        yield f"源目录: {report.get('source', '')}"
+        yield f"输出目录: {report.get('output', '')}"
+        yield f"发现媒体文件数: {report.get('total_media', 0)}"
+        yield f"待处理主文件数: {report.get('to_process', 0)}"
+        yield "----------------------------------------"
         entries = report.get("entries") or []
-        move_n = sum(1 for e in entries if e[0] == "move")
-        related_n = sum(1 for e in entries if e[0] == "related")
-        skip_n = sum(1 for e in entries if e[0] == "skip")
-        already_n = sum(1 for e in entries if e[0] == "already_processed")
-        fail_n = sum(1 for e in entries if e[0].startswith("fail"))
+        basename = os.path.basename  # 逐条循环内用局部名，省去属性查找
+        counts = dict.fromkeys(("move", "related", "skip", "already_processed", "fail"), 0)
         for act, src, dest in entries:
-            if act == "move":
-                lines.append(f"  [将移动] {Path(src).name} -> {dest}")
-            elif act == "related":
-                lines.append(f"  [关联]   {Path(src).name} -> {dest}")
-            elif act == "skip":
-                lines.append(f"  [跳过]   {Path(src).name} ({dest})")
-            elif act == "already_processed":
-                lines.append(f"  [已整理过] {Path(src).name} ({dest or '此前已整理'})")
-            elif act.startswith("fail"):
-                lines.append(f"  [失败]   {Path(src).name} - {dest}")
-        lines.append("----------------------------------------")
-        lines.append(f"统计: 主文件移动={move_n} 关联={related_n} 跳过={skip_n} 已整理过={already_n} 失败={fail_n}")
-        lines.append("==========================================")
-        return "\n".join(lines)
+            if act.startswith("fail"):
+                act = "fail"
+            fmt = _SCAN_REPORT_LINES.get(act)
+            if fmt is None:
+                continue
+            counts[act] += 1
+            yield fmt(basename(src), dest)
+        yield "----------------------------------------"
+        yield (
+            f"统计: 主文件移动={counts['move']} 关联={counts['related']} 跳过={counts['skip']} "
+            f"已整理过={counts['already_processed']} 失败={counts['fail']}"
+        )
+        yield "=========================================="
 
     def run_scan():
         config.source_path = src_var.get().strip()
         config.output_path = out_var.get().strip()
         config.delete_empty_folders = delete_empty_var.get()
-        config.save_config()
         if not config.source_path:
             messagebox.showwarning("提示", "请选择源文件夹")
             return
@@ -168,33 +233,81 @@ def main():
             return
         output = Path(config.output_path) if config.output_path else None
         scan_only = dry_var.get()
+        save_config_async()
 
-        def work():
+        if scan_only:
+            log_append("开始扫描（仅报告，不移动）…")
+        else:
+            log_append("开始整理…")
+        # 固定用 spawn：fork 会把界面进程里可能被其他线程持有的锁、exiftool 常驻进程一并复制进子进程
+        mp = multiprocessing.get_context("spawn")
+        results = mp.Queue()
+        proc = mp.Process(
+            target=_scan_worker, args=(config, source, output, scan_only, results), daemon=True
+        )
+        proc.start()
+        scan_progress.config(value=0, maximum=100)
+        scan_progress_label.config(text="")
+
+        def merge_metadata():
+            # 子进程已把识别结果写入 metadata_cache.json；超级拷贝复用的实例随后保存时须先并入，不能覆盖
+            organizer = _organizer
+            if organizer is not None:
+                organizer.merge_metadata_store()
+
+        def on_done(report):
+            append_line = log_append  # 报告可能有上万行，循环内用局部名
+            for line in iter_scan_report_lines(report):
+                append_line(line)
             if scan_only:
-                log_append("开始扫描（仅报告，不移动）…")
+                log_append("扫描完成。以上为将执行的操作预览。")
+                messagebox.showinfo("完成", "扫描完成，结果已输出到运行日志。")
             else:
-                log_append("开始整理…")
-            try:
-                organizer = MediaOrganizer(config)
-                report = organizer.scan_and_organize(
-                    source=source, output=output, dry_run=False, scan_only=scan_only
-                )
-                report_text = format_scan_report(report)
-                def on_done():
-                    if report_text:
-                        for line in report_text.splitlines():
-                            log_append(line)
-                    if scan_only:
-                        log_append("扫描完成。以上为将执行的操作预览。")
-                        messagebox.showinfo("完成", "扫描完成，结果已输出到运行日志。")
-                    else:
-                        log_append("整理完成。以上为本次任务报告。")
-                        messagebox.showinfo("完成", "整理完成，任务报告已输出到运行日志。")
-                root.after(0, on_done)
-            except Exception as e:
-                root.after(0, lambda: (log_append("错误: " + str(e)), messagebox.showerror("错误", str(e))))
+                log_append("整理完成。以上为本次任务报告。")
+                messagebox.showinfo("完成", "整理完成，任务报告已输出到运行日志。")
 
-        threading.Thread(target=work, daemon=True).start()
+        def on_error(msg):
+            log_append("错误: " + msg)
+            messagebox.showerror("错误", msg)
+
+        def poll():
+            progress = None
+            for _ in range(LOG_DRAIN_MAX_LINES):
+                try:
+                    # 子进程退出后管道中可能仍有未读完的消息，稍等再判定
+                    msg = results.get(timeout=0 if proc.is_alive() else 1)
+                except queue.Empty:
+                    if proc.is_alive():
+                        break
+                    threading.Thread(target=merge_metadata, daemon=True).start()
+                    on_error(f"整理进程意外退出（退出码 {proc.exitcode}）")
+                    return
+                kind = msg[0]
+                if kind == "log":
+                    log_append(msg[1])
+                elif kind == "progress":
+                    progress = msg[1:]
+                else:
+                    proc.join()
+                    threading.Thread(target=merge_metadata, daemon=True).start()
+                    if kind == "done":
+                        total = msg[1].get("to_process") if isinstance(msg[1], dict) else 0
+                        if total:
+                            scan_progress.config(maximum=total, value=total)
+                            scan_progress_label.config(text=f"完成: {total} / {total}")
+                        on_done(msg[1])
+                    else:
+                        on_error(msg[1])
+                    return
+            # 一个周期内只按最新的进度重绘一次
+            if progress is not None:
+                cur, total = progress
+                if total:
+                    scan_progress.config(maximum=total, value=cur)
+                    scan_progress_label.config(text=f"当前: {cur} / {total}")
+            root.after(LOG_DRAIN_MS, poll)
+
+        root.after(LOG_DRAIN_MS, poll)
 
     scan_btn = ttk.Button(scan_card, text="开始整理", command=run_scan, **_bs("success"))
     scan_btn.pack(anchor=W, pady=(4, 8))
@@ -212,7 +325,7 @@ def main():
 
     copy_card = ttk.Labelframe(
         copy_frm,
-        text="超级拷贝：拷贝到目标 + 自动整理 + SHA256 哈希校验",
+        text="超级拷贝：拷贝到目标 + 自动整理 + 哈希校验",
         **_lf_style(),
     )
     copy_card.pack(fill=X, expand=False, pady=4)
@@ -255,8 +368,8 @@ def main():
     copy_progress = ttk.Progressbar(progress_frm, mode="determinate", maximum=100, value=0)
     copy_progress.pack(fill=X, pady=(2, 0))
 
-    def format_super_copy_report(stats_with_report):
-        """将超级拷贝结果格式化为完整任务报告文本。"""
+    def iter_super_copy_report_lines(stats_with_report):
+        """逐行生成超级拷贝任务报告，直接送入日志队列。"""
         ok = stats_with_report.get("ok", 0)
         fail = stats_with_report.get("fail", 0)
         skip = stats_with_report.get("skip", 0)
@@ -266,39 +379,37 @@ def main():
         media_fail = report.get("media_fail") or []
         other_ok = report.get("other_ok") or []
         other_fail = report.get("other_fail") or []
-        lines = [
-            "========== 超级拷贝任务报告 ==========",
-            f"统计: 成功={ok} 失败={fail} 跳过={skip}",
-            "----------------------------------------",
-        ]
+        algo = (stats_with_report.get("hash_algo") or "").upper()
+        basename = os.path.basename
+        yield "========== 超级拷贝任务报告 =========="
+        yield f"统计: 成功={ok} 失败={fail} 跳过={skip}" + (f" 校验={algo}" if algo else "")
+        yield "----------------------------------------"
         if media_ok:
-            lines.append("【媒体/关联 已拷贝】")
+            yield "【媒体/关联 已拷贝】"
             for src, dest in media_ok:
-                lines.append(f"  {Path(src).name} -> {Path(dest).name}")
+                yield f"  {basename(src)} -> {basename(dest)}"
         if media_skip:
-            lines.append("【媒体 已跳过（目标已存在）】")
+            yield "【媒体 已跳过（目标已存在）】"
             for src, reason in media_skip:
-                lines.append(f"  {Path(src).name} ({reason})")
+                yield f"  {basename(src)} ({reason})"
         if media_fail:
-            lines.append("【媒体/关联 拷贝失败】")
+            yield "【媒体/关联 拷贝失败】"
             for src, err in media_fail:
-                lines.append(f"  {Path(src).name} - {err}")
+                yield f"  {basename(src)} - {err}"
         if other_ok:
-            lines.append("【其他文件 已拷贝】")
+            yield "【其他文件 已拷贝】"
             for rel in other_ok:
-                lines.append(f"  {rel}")
+                yield f"  {rel}"
         if other_fail:
-            lines.append("【其他文件 拷贝失败】")
+            yield "【其他文件 拷贝失败】"
             for rel, err in other_fail:
-                lines.append(f"  {rel} - {err}")
-        lines.append("==========================================")
-        return "\n".join(lines)
+                yield f"  {rel} - {err}"
+        yield "=========================================="
 
     def run_super_copy():
         config.super_copy_source = copy_src_var.get().strip()
         config.super_copy_target = copy_tgt_var.get().strip()
         config.delete_empty_folders = delete_empty_var.get()
-        config.save_config()
         if not config.super_copy_source:
             messagebox.showwarning("提示", "请选择待拷贝的源文件夹")
             return
@@ -311,54 +422,76 @@ def main():
             messagebox.showerror("错误", f"源路径不存在: {source}")
             return
         dry = copy_dry_var.get()
+        save_config_async()
+        copy_btn.configure(state=DISABLED)
+
+        # 工作线程只记录最新进度，界面线程按 PROGRESS_TICK_MS 定时重绘，不再为每个进度事件调度一次界面更新
+        pstate = {"cur": 0, "total": 0, "msg": "", "dirty": False, "running": True}
+
+        def tick():
+            if not pstate["running"]:
+                return
+            if pstate["dirty"]:
+                pstate["dirty"] = False
+                cur, total, message = pstate["cur"], pstate["total"], pstate["msg"]
+                copy_progress["maximum"] = total
+                copy_progress["value"] = cur
+                lbl = f"当前: {cur} / {total}"
+                if message:
+                    lbl += " · " + (message[:60] + "…" if len(message) > 60 else message)
+                progress_label.config(text=lbl)
+            root.after(PROGRESS_TICK_MS, tick)
 
         def work():
             def progress_cb(phase, message, current, total):
-                def update():
-                    if total is not None and total > 0 and current is not None:
-                        copy_progress["maximum"] = total
-                        copy_progress["value"] = current
-                        lbl = f"当前: {current} / {total}"
-                        if message:
-                            lbl += " · " + (message[:60] + "…" if len(message) > 60 else message)
-                        progress_label.config(text=lbl)
-                    if message:
-                        log_append(message)
-                try:
-                    root.after(0, update)
-                except Exception:
-                    pass
+                if total is not None and total > 0 and current is not None:
+                    pstate.update(cur=current, total=total, msg=message, dirty=True)
+                if message:
+                    log_append(message)
 
-            root.after(0, lambda: (copy_progress.config(value=0, maximum=100), progress_label.config(text="")))
-            log_append("超级拷贝 开始…")
             try:
-                organizer = MediaOrganizer(config)
-                stats = organizer.super_copy_and_organize(
-                    source=source, target=target, dry_run=dry, progress_cb=progress_cb
-                )
+                with _organizer_lock:
+                    organizer = _get_organizer(config)
+                    log_append(f"超级拷贝 开始…（校验算法 {organizer.hash_algo.upper()}）")
+                    stats = organizer.super_copy_and_organize(
+                        source=source, target=target, dry_run=dry, progress_cb=progress_cb
+                    )
                 msg = f"超级拷贝完成: 成功={stats['ok']} 失败={stats['fail']} 跳过={stats['skip']}"
                 detail = "\n完整任务报告已输出到运行日志。\n详见 " + get_log_file_path()
                 if stats["ok"] == 0 and stats["fail"] == 0 and stats["skip"] == 0:
                     detail = "\n\n未发现可处理的媒体文件。请确认：\n1) 源目录下是否有 .jpg/.mp4/.mov 等图片/视频/音频；\n2) config.json 中的扩展名配置。" + detail
-                report_text = format_super_copy_report(stats)
+                log_append(msg)
+                append_line = log_append
+                for line in iter_super_copy_report_lines(stats):
+                    append_line(line)
 
                 def done():
-                    total = copy_progress["maximum"]
+                    pstate["running"] = False
+                    copy_btn.configure(state=NORMAL)
+                    total = pstate["total"]
                     if total and total > 0:
+                        copy_progress["maximum"] = total
                         copy_progress["value"] = total
                         progress_label.config(text=f"完成: {total} / {total}")
-                    log_append(msg)
-                    if report_text:
-                        for line in report_text.splitlines():
-                            log_append(line)
                     messagebox.showinfo("完成", msg + detail)
                 root.after(0, done)
             except Exception as e:
-                root.after(0, lambda: (log_append("错误: " + str(e)), messagebox.showerror("错误", str(e))))
-
+                err = str(e)
+
+                def failed():
+                    pstate["running"] = False
+                    copy_btn.configure(state=NORMAL)
+                    log_append("错误: " + err)
+                    messagebox.showerror("错误", err)
+                root.after(0, failed)
+
+        copy_progress.config(value=0, maximum=100)
+        progress_label.config(text="")
+        root.after(PROGRESS_TICK_MS, tick)
         threading.Thread(target=work, daemon=True).start()
 
-    ttk.Button(copy_card, text="开始超级拷贝", command=run_super_copy, **_bs("primary")).pack(anchor=W, pady=(4, 8))
+    copy_btn = ttk.Button(copy_card, text="开始超级拷贝", command=run_super_copy, **_bs("primary"))
+    copy_btn.pack(anchor=W, pady=(4, 8))
 
     # ===== 共用日志区（卡片式）=====
     ttk.Separator(main_frm, orient="horizontal").pack(fill=X, pady=(12, 8))
@@ -379,11 +512,40 @@ def main():
     )
     log_text.pack(fill=BOTH, expand=True)
 
+    log_queue: "queue.Queue[str]" = queue.Queue()
+    # 配置保存串行执行；解释器退出时会等待尚未完成的保存
+    config_saver = ThreadPoolExecutor(max_workers=1, thread_name_prefix="config-save")
+
     def log_append(msg: str):
-        log_text.configure(state=NORMAL)
-        log_text.insert(END, msg + "\n")
-        log_text.see(END)
-        log_text.configure(state=DISABLED)
+        """追加一行日志，任何线程均可调用；实际写入由 drain_log 在界面线程批量完成。"""
+        log_queue.put(msg)
+
+    def save_config_async():
+        """在后台单线程里保存配置：点击按钮时不在界面线程上做磁盘 I/O，多次保存按提交顺序依次执行。"""
+        def saved(future):
+            err = future.exception()
+            if err is not None:
+                log_append(f"保存配置失败: {err}")
+        config_saver.submit(config.save_config).add_done_callback(saved)
+
+    def drain_log():
+        lines = []
+        try:
+            while len(lines) < LOG_DRAIN_MAX_LINES:
+                lines.append(log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if lines:
+            # 用户已向上翻看时不再自动滚到底部，只在视图停在末尾附近时跟随新日志
+            follow = log_text.yview()[1] >= LOG_FOLLOW_THRESHOLD
+            log_text.configure(state=NORMAL)
+            log_text.insert(END, "\n".join(lines) + "\n")
+            log_text.configure(state=DISABLED)
+            if follow:
+                log_text.see(END)
+        root.after(LOG_DRAIN_MS, drain_log)
+
+    root.after(LOG_DRAIN_MS, drain_log)
 
     btn_row = ttk.Frame(main_frm)
     btn_row.pack(fill=X)
@@ -393,4 +555,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
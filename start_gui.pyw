@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 """Launch GUI (no console). Use pythonw.exe or double-click."""
 
+import multiprocessing
 import sys
 import os
 
@@ -9,17 +10,29 @@ script_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, script_dir)
 os.chdir(script_dir)
 
-try:
-    from main import main
-    main()
-except ImportError:
+# 整理任务在子进程中运行；Windows 下子进程会重新导入本脚本，入口必须加保护
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
     try:
-        import importlib.util
-        gui_path = os.path.join(script_dir, "organizer_gui.py")
-        spec = importlib.util.spec_from_file_location("organizer_gui", gui_path)
-        gui_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(gui_module)
-        gui_module.main()
+        from main import main
+        main()
+    except ImportError:
+        try:
+            import importlib.util
+            gui_path = os.path.join(script_dir, "organizer_gui.py")
+            spec = importlib.util.spec_from_file_location("organizer_gui", gui_path)
+            gui_module = importlib.util.module_from_spec(spec)
+            # 子进程按模块名反序列化任务函数，须先登记到 sys.modules
+            sys.modules["organizer_gui"] = gui_module
+            spec.loader.exec_module(gui_module)
+            gui_module.main()
+        except Exception as e:
+            try:
+                import tkinter.messagebox as messagebox
+                messagebox.showerror("Start Error", "Failed to start:\n%s" % str(e))
+            except Exception:
+                pass
+            sys.exit(1)
     except Exception as e:
         try:
             import tkinter.messagebox as messagebox
@@ -27,10 +40,3 @@ except ImportError:
         except Exception:
             pass
         sys.exit(1)
-except Exception as e:
-    try:
-        import tkinter.messagebox as messagebox
-        messagebox.showerror("Start Error", "Failed to start:\n%s" % str(e))
-    except Exception:
-        pass
-    sys.exit(1)